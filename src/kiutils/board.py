@@ -16,6 +16,7 @@ Documentation taken from:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from io import StringIO
 from typing import Optional, List, Dict
 from os import path
 
@@ -24,7 +25,7 @@ from kiutils.items.zones import Zone
 from kiutils.items.brditems import *
 from kiutils.items.gritems import *
 from kiutils.items.dimensions import Dimension
-from kiutils.utils.strings import dequote
+from kiutils.utils.strings import dequote, INDENTS
 from kiutils.utils import sexpr
 from kiutils.footprint import Footprint
 from kiutils.misc.config import KIUTILS_CREATE_NEW_VERSION_STR, KIUTILS_CREATE_NEW_GENERATOR_STR
@@ -238,86 +239,103 @@ class Board():
             filepath = self.filePath
 
         with open(filepath, 'w', encoding=encoding) as outfile:
-            outfile.write(self.to_sexpr())
+            self.write_to(outfile)
 
-    def to_sexpr(self, indent=0, newline=True) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf, indent=0, newline=True) -> None:
+        """Write the S-Expression representing this object into the given buffer or file
 
         Args:
+            - buf: Text buffer or file object the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 0.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         addNewLine = False
 
-        expression =  f'{indents}(kicad_pcb (version {self.version}) (generator {self.generator})\n\n'
-        expression += self.general.to_sexpr(indent+2) + '\n'
-        expression += self.paper.to_sexpr(indent+2)
+        buf.write(f'{indents}(kicad_pcb (version {self.version}) (generator {self.generator})\n\n')
+        buf.write(self.general.to_sexpr(indent+2) + '\n')
+        buf.write(self.paper.to_sexpr(indent+2))
         if self.titleBlock is not None:
-            expression += self.titleBlock.to_sexpr(indent+2) + '\n'
-        expression += f'{indents}  (layers\n'
+            buf.write(self.titleBlock.to_sexpr(indent+2) + '\n')
+        buf.write(f'{indents}  (layers\n')
         for layer in self.layers:
-            expression += layer.to_sexpr(indent+4)
-        expression += f'{indents}  )\n\n'
-        expression += self.setup.to_sexpr(indent+2) + '\n'
+            buf.write(layer.to_sexpr(indent+4))
+        buf.write(f'{indents}  )\n\n')
+        buf.write(self.setup.to_sexpr(indent+2) + '\n')
         # Properties, if any
         if len(self.properties) > 0:
             for key, value in self.properties.items():
-                expression += f'  (property "{dequote(key)}" "{dequote(value)}")\n'
-            expression += '\n'
+                buf.write(f'  (property "{dequote(key)}" "{dequote(value)}")\n')
+            buf.write('\n')
 
         # Nets
         if len(self.nets) > 0:
             for net in self.nets:
-                expression += net.to_sexpr(indent=indent+2, newline=True)
-            expression += '\n'
+                buf.write(net.to_sexpr(indent=indent+2, newline=True))
+            buf.write('\n')
 
         # Footprints
         for footprint in self.footprints:
-            expression += footprint.to_sexpr(indent+2, layerInFirstLine=True) + '\n'
+            footprint.write_to(buf, indent+2, layerInFirstLine=True)
+            buf.write('\n')
 
         # Lines, Texts, Arcs and other graphical items
         if len(self.graphicItems) > 0:
             addNewLine = True
             for item in self.graphicItems:
-                if isinstance(item, GrPoly):
-                    expression += item.to_sexpr(indent+2, pts_newline=True)
+                # Items without a write_to() method (e.g. images) are written via their to_sexpr()
+                write_to = getattr(item, 'write_to', None)
+                if write_to is None:
+                    buf.write(item.to_sexpr(indent+2))
+                elif isinstance(item, GrPoly):
+                    # Board polygons put each point on its own line
+                    write_to(buf, indent+2, pts_newline=True)
                 else:
-                    expression += item.to_sexpr(indent+2)
+                    write_to(buf, indent+2)
 
         # Dimensions
         if len(self.dimensions) > 0:
             addNewLine = True
             for dimension in self.dimensions:
-                expression += dimension.to_sexpr(indent+2)
+                buf.write(dimension.to_sexpr(indent+2))
 
         # Target markers:
         if len(self.targets) > 0:
             addNewLine = True
             for target in self.targets:
-                expression += target.to_sexpr(indent+2)
+                buf.write(target.to_sexpr(indent+2))
 
         if addNewLine:
-            expression += '\n'
+            buf.write('\n')
 
         # Segments, vias and arcs
         if len(self.traceItems) > 0:
             for item in self.traceItems:
-                expression += item.to_sexpr(indent+2)
-            expression += '\n'
+                buf.write(item.to_sexpr(indent+2))
+            buf.write('\n')
 
         # Zones
         for zone in self.zones:
-            expression += zone.to_sexpr(indent+2)
+            buf.write(zone.to_sexpr(indent+2))
 
         # Groups
         for group in self.groups:
-            expression += group.to_sexpr(indent+2)
+            buf.write(group.to_sexpr(indent+2))
+
+        buf.write(f'{indents}){endline}')
+
+    def to_sexpr(self, indent=0, newline=True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 0.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
 
-        expression += f'{indents}){endline}'
-        return expression
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
@@ -91,7 +91,7 @@ class Constraint():
         object = cls()
         object.type = exp[1]
         for item in exp[2:]:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 object.elements.append(item)
             if item[0] == 'min': object.min = item[1]
             if item[0] == 'opt': object.opt = item[1]
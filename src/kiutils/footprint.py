@@ -19,6 +19,7 @@ import calendar
 import datetime
 import re
 from dataclasses import dataclass, field
+from io import StringIO
 from typing import Optional, List, Dict
 from os import path
 
@@ -27,7 +28,7 @@ from kiutils.items.common import Image, Position, Coordinate, Net, Group, Font
 from kiutils.items.fpitems import *
 from kiutils.items.gritems import *
 from kiutils.utils import sexpr
-from kiutils.utils.strings import dequote, remove_prefix
+from kiutils.utils.strings import dequote, remove_prefix, INDENTS
 from kiutils.misc.config import KIUTILS_CREATE_NEW_VERSION_STR
 
 @dataclass
@@ -270,7 +271,7 @@ class DrillDefinition():
 
         # The ``offset`` token may not be given
         for item in exp:
-            if type(item) != type([]): continue
+            if not isinstance(item, list): continue
             if item[0] == 'offset': object.offset = Position().from_sexpr(item)
         return object
 
@@ -503,7 +504,7 @@ class Pad():
         object.shape = exp[3]
 
         for item in exp[3:]:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
 
             if item[0] == 'at': object.position = Position().from_sexpr(item)
@@ -1004,20 +1005,18 @@ class Footprint():
             filepath = self.filePath
 
         with open(filepath, 'w', encoding=encoding) as outfile:
-            outfile.write(self.to_sexpr())
+            self.write_to(outfile)
 
-    def to_sexpr(self, indent=0, newline=True, layerInFirstLine=False) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf, indent=0, newline=True, layerInFirstLine=False) -> None:
+        """Write the S-Expression representing this object into the given buffer or file
 
         Args:
+            - buf: Text buffer or file object the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 0.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
             - layerInFirstLine (bool): Prints the ``layer`` token in the first line. Defaults to False
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         locked = ' locked' if self.locked else ''
@@ -1026,73 +1025,91 @@ class Footprint():
         generator = f' (generator {self.generator})' if self.generator is not None else ''
         tstamp = f' (tstamp {self.tstamp})' if self.tstamp is not None else ''
 
-        expression =  f'{indents}(footprint "{dequote(self.libId)}"{locked}{placed}{version}{generator}'
+        buf.write(f'{indents}(footprint "{dequote(self.libId)}"{locked}{placed}{version}{generator}')
         if layerInFirstLine:
-            expression += f' (layer "{dequote(self.layer)}")\n'
+            buf.write(f' (layer "{dequote(self.layer)}")\n')
         else:
-            expression += f'\n{indents}  (layer "{dequote(self.layer)}")\n'
-        expression += f'{indents}  (tedit {self.tedit}){tstamp}\n'
+            buf.write(f'\n{indents}  (layer "{dequote(self.layer)}")\n')
+        buf.write(f'{indents}  (tedit {self.tedit}){tstamp}\n')
 
         if self.position is not None:
             angle = f' {self.position.angle}' if self.position.angle is not None else ''
-            expression += f'{indents}  (at {self.position.X} {self.position.Y}{angle})\n'
+            buf.write(f'{indents}  (at {self.position.X} {self.position.Y}{angle})\n')
         if self.description is not None:
-            expression += f'{indents}  (descr "{dequote(self.description)}")\n'
+            buf.write(f'{indents}  (descr "{dequote(self.description)}")\n')
         if self.tags is not None:
-            expression += f'{indents}  (tags "{dequote(self.tags)}")\n'
+            buf.write(f'{indents}  (tags "{dequote(self.tags)}")\n')
         for item in self.properties:
-            expression += f'{indents}  (property "{dequote(item)}" "{dequote(self.properties[item])}")\n'
+            buf.write(f'{indents}  (property "{dequote(item)}" "{dequote(self.properties[item])}")\n')
         if self.path is not None:
-            expression += f'{indents}  (path "{dequote(self.path)}")\n'
+            buf.write(f'{indents}  (path "{dequote(self.path)}")\n')
 
         # Additional parameters used in board
         if self.autoplaceCost90 is not None:
-            expression += f'{indents}  (autoplace_cost90 {self.autoplaceCost90})\n'
+            buf.write(f'{indents}  (autoplace_cost90 {self.autoplaceCost90})\n')
         if self.autoplaceCost180 is not None:
-            expression += f'{indents}  (autoplace_cost180 {self.autoplaceCost180})\n'
+            buf.write(f'{indents}  (autoplace_cost180 {self.autoplaceCost180})\n')
         if self.solderMaskMargin is not None:
-            expression += f'{indents}  (solder_mask_margin {self.solderMaskMargin})\n'
+            buf.write(f'{indents}  (solder_mask_margin {self.solderMaskMargin})\n')
         if self.solderPasteMargin is not None:
-            expression += f'{indents}  (solder_paste_margin {self.solderPasteMargin})\n'
+            buf.write(f'{indents}  (solder_paste_margin {self.solderPasteMargin})\n')
         if self.solderPasteRatio is not None:
-            expression += f'{indents}  (solder_paste_ratio {self.solderPasteRatio})\n'
+            buf.write(f'{indents}  (solder_paste_ratio {self.solderPasteRatio})\n')
         if self.clearance is not None:
-            expression += f'{indents}  (clearance {self.clearance})\n'
+            buf.write(f'{indents}  (clearance {self.clearance})\n')
         if self.zoneConnect is not None:
-            expression += f'{indents}  (zone_connect {self.zoneConnect})\n'
+            buf.write(f'{indents}  (zone_connect {self.zoneConnect})\n')
         if self.thermalWidth is not None:
-            expression += f'{indents}  (thermal_width {self.thermalWidth})\n'
+            buf.write(f'{indents}  (thermal_width {self.thermalWidth})\n')
         if self.thermalGap is not None:
-            expression += f'{indents}  (thermal_gap {self.thermalGap})\n'
+            buf.write(f'{indents}  (thermal_gap {self.thermalGap})\n')
 
         if self.attributes is not None:
             # Note: If the attribute object has only standard values in it, it will return an
             #       empty string. Therefore, it should create its own newline and indentations only
             #       when needed.
-            expression += self.attributes.to_sexpr(indent=indent+2, newline=True)
+            buf.write(self.attributes.to_sexpr(indent=indent+2, newline=True))
         if self.privateLayers:
-            expression += f'{indents}  (private_layers'
+            buf.write(f'{indents}  (private_layers')
             for item in self.privateLayers:
-                expression += f' "{dequote(item)}"'
-            expression += f')\n'
+                buf.write(f' "{dequote(item)}"')
+            buf.write(f')\n')
             
         if self.netTiePadGroups:
-            expression += f'{indents}  (net_tie_pad_groups'
+            buf.write(f'{indents}  (net_tie_pad_groups')
             for item in self.netTiePadGroups:
-                expression += f' "{dequote(item)}"'
-            expression += f')\n'
+                buf.write(f' "{dequote(item)}"')
+            buf.write(f')\n')
 
         for item in self.graphicItems:
-            expression += item.to_sexpr(indent=indent+2)
+            # Items without a write_to() method (e.g. images) are written via their to_sexpr()
+            write_to = getattr(item, 'write_to', None)
+            if write_to is not None:
+                write_to(buf, indent=indent+2)
+            else:
+                buf.write(item.to_sexpr(indent=indent+2))
         for item in self.pads:
-            expression += item.to_sexpr(indent=indent+2)
+            buf.write(item.to_sexpr(indent=indent+2))
         for item in self.zones:
-            expression += item.to_sexpr(indent=indent+2)
+            buf.write(item.to_sexpr(indent=indent+2))
         for item in self.models:
-            expression += item.to_sexpr(indent=indent+2)
+            buf.write(item.to_sexpr(indent=indent+2))
         for item in self.groups:
-            expression += item.to_sexpr(indent=indent+2)
+            buf.write(item.to_sexpr(indent=indent+2))
 
-        expression += f'{indents}){endline}'
-        return expression
+        buf.write(f'{indents}){endline}')
 
+    def to_sexpr(self, indent=0, newline=True, layerInFirstLine=False) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 0.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+            - layerInFirstLine (bool): Prints the ``layer`` token in the first line. Defaults to False
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline, layerInFirstLine)
+        return buf.getvalue()
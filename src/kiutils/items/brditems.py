@@ -254,7 +254,7 @@ class StackupLayer():
         object = cls()
         object.name = exp[1]
         for item in exp[2:]:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 # Start parsing the layer's sublayer if the first sublayer token was found
                 if item == 'addsublayer':
                     if parsingSublayer:
@@ -805,7 +805,7 @@ class Segment():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
                 continue
             if item[0] == 'start': object.start = Position().from_sexpr(item)
@@ -898,7 +898,7 @@ class Via():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
                 if item == 'micro' or item == 'blind': object.type = item
                 continue
@@ -997,7 +997,7 @@ class Arc():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
                 continue
             if item[0] == 'start': object.start = Position().from_sexpr(item)
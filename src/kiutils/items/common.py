@@ -20,6 +20,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict
 
+from kiutils.utils.slots import add_slots
 from kiutils.utils.strings import dequote
 
 @dataclass
@@ -70,8 +71,8 @@ class Position():
             if exp[3] != 'unlocked':
                 object.angle = exp[3]
 
-        for item in exp:
-            if item == 'unlocked': object.unlocked = True
+        if 'unlocked' in exp:
+            object.unlocked = True
 
         return object
 
@@ -79,6 +80,23 @@ class Position():
         """This object does not have a direct S-Expression representation."""
         raise NotImplementedError("This object does not have a direct S-Expression representation")
 
+def position_from_xy(item: list) -> Position:
+    """Fast path to create a Position object from fixed coordinate tokens like ``(start X Y)``,
+    ``(end X Y)``, ``(mid X Y)``, ``(center X Y)`` or ``(xy X Y)``. These never carry the
+    ``unlocked`` flag, so the generic parsing done in ``Position.from_sexpr()`` can be skipped.
+
+    Args:
+        - item (list): Part of parsed S-Expression ``(start|end|mid|center|xy X Y)``
+
+    Returns:
+        - Position: Object of the class initialized with the given S-Expression
+    """
+    p = Position.__new__(Position)
+    p.X = item[1]
+    p.Y = item[2]
+    p.angle = item[3] if len(item) > 3 else None
+    p.unlocked = False
+    return p
 
 @dataclass
 class Coordinate():
@@ -134,6 +152,7 @@ class Coordinate():
         return f'{indents}(xyz {self.X} {self.Y} {self.Z}){endline}'
 
 
+@add_slots
 @dataclass
 class ColorRGBA():
     """The ``color`` token defines a RGBA color"""
@@ -244,7 +263,7 @@ class Stroke():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 continue
             if item[0] == 'width': object.width = item[1]
             if item[0] == 'type':  object.type = item[1]
@@ -326,7 +345,7 @@ class Font():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'bold': object.bold = True
                 if item == 'italic': object.italic = True
                 continue
@@ -479,7 +498,7 @@ class Effects():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'hide': object.hide = True
                 else: continue
             if item[0] == 'font': object.font = Font().from_sexpr(item)
@@ -601,7 +620,7 @@ class Group():
         object = cls()
         object.name = exp[1]
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
                 continue
             if item[0] == 'id': object.id = item[1]
@@ -684,7 +703,7 @@ class PageSettings():
             object.width = exp[2]
             object.height = exp[3]
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'portrait': object.portrait = True
                 continue
         return object
@@ -1160,6 +1179,7 @@ class Image():
         expression += f'{indents}){endline}'
         return expression
 
+@add_slots
 @dataclass
 class ProjectInstance(ABC):
     """The ``instances`` token defines a project instance and serves as an abstract base class for
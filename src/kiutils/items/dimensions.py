@@ -84,7 +84,7 @@ class DimensionFormat():
 
         object = cls()
         for item in exp[1:]:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'suppress_zeroes': object.suppressZeroes = True
                 continue
             if item[0] == 'prefix': object.prefix = item[1]
@@ -181,7 +181,7 @@ class DimensionStyle():
 
         object = cls()
         for item in exp[1:]:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'keep_text_aligned': object.keepTextAligned = True
                 continue
             if item[0] == 'thickness': object.thickness = item[1]
@@ -281,7 +281,7 @@ class Dimension():
 
         object = cls()
         for item in exp[1:]:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
                 continue
             if item[0] == 'type': object.type = item[1]
@@ -18,14 +18,18 @@ Documentation taken from:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from io import StringIO
+from sys import intern
 from typing import Optional, List
 
-from kiutils.items.common import RenderCache, Stroke, Position, Effects
-from kiutils.utils.strings import dequote
+from kiutils.items.common import RenderCache, Stroke, Position, Effects, position_from_xy
+from kiutils.utils.slots import add_slots
+from kiutils.utils.strings import dequote, dequote_layer, width_or_stroke_token, INDENTS
 
 # FIXME: Several classes have a ``stroke`` member. This feature will be introduced in KiCad 7 and
 #        has yet to be tested here.
 
+@add_slots
 @dataclass
 class FpText():
     """The ``fp_text`` token defines a graphic line in a footprint definition.
@@ -41,7 +45,7 @@ class FpText():
     text: str = "%REF"
     """The ``text`` attribute is a string that defines the text"""
 
-    position: Position = field(default_factory=lambda: Position())
+    position: Position = field(default_factory=Position)
     """The ``position`` defines the X and Y position coordinates and optional orientation angle of
     the text"""
 
@@ -55,7 +59,7 @@ class FpText():
     hide: bool = False
     """The optional ``hide`` token, defines if the text is hidden"""
 
-    effects: Effects = field(default_factory=lambda: Effects())
+    effects: Effects = field(default_factory=Effects)
     """The ``effects`` token defines how the text is displayed"""
 
     tstamp: Optional[str] = None      # Used since KiCad 6
@@ -88,34 +92,33 @@ class FpText():
             raise Exception("Expression does not have the correct type")
 
         object = cls()
-        object.type = exp[1]
+        object.type = intern(exp[1])
         object.text = exp[2]
         for item in exp[3:]:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'hide': object.hide = True
                 continue
-            if item[0] == 'at': object.position = Position().from_sexpr(item)
-            if item[0] == 'layer': 
-                object.layer = item[1]
+            token = item[0]
+            if token == 'at': object.position = Position.from_sexpr(item)
+            elif token == 'layer': 
+                object.layer = intern(item[1])
                 if(len(item) > 2):
                     if(item[2] == "knockout"):
                         object.knockout = True
-            if item[0] == 'effects': object.effects = Effects().from_sexpr(item)
-            if item[0] == 'tstamp': object.tstamp = item[1]
-            if item[0] == 'render_cache': object.renderCache = RenderCache.from_sexpr(item)
+            elif token == 'effects': object.effects = Effects.from_sexpr(item)
+            elif token == 'tstamp': object.tstamp = item[1]
+            elif token == 'render_cache': object.renderCache = RenderCache.from_sexpr(item)
         return object
 
-    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
 
         Args:
+            - buf (StringIO): Buffer the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         hide = ' hide' if self.hide else ''
@@ -123,15 +126,29 @@ class FpText():
         posA = f' {self.position.angle}' if self.position.angle is not None else ''
         ko = ' knockout' if self.knockout else ''
 
-        expression =  f'{indents}(fp_text {self.type} "{dequote(self.text)}" (at {self.position.X} {self.position.Y}{posA}{unlocked}) (layer "{dequote(self.layer)}"{ko}){hide}\n'
-        expression += f'{indents}  {self.effects.to_sexpr()}'
+        buf.write(f'{indents}(fp_text {self.type} "{dequote(self.text)}" (at {self.position.X} {self.position.Y}{posA}{unlocked}) (layer "{dequote_layer(self.layer)}"{ko}){hide}\n')
+        buf.write(f'{indents}  {self.effects.to_sexpr()}')
         if self.tstamp is not None:
-            expression += f'{indents}  (tstamp {self.tstamp})\n'
+            buf.write(f'{indents}  (tstamp {self.tstamp})\n')
         if self.renderCache is not None:
-            expression += self.renderCache.to_sexpr(indent+2)
-        expression += f'{indents}){endline}'
-        return expression
+            buf.write(self.renderCache.to_sexpr(indent+2))
+        buf.write(f'{indents}){endline}')
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
 
+@add_slots
 @dataclass
 class FpLine():
     """The ``fp_line`` token defines a graphic line in a footprint definition.
@@ -140,10 +157,10 @@ class FpLine():
         https://dev-docs.kicad.org/en/file-formats/sexpr-intro/index.html#_footprint_line
     """
 
-    start: Position = field(default_factory=lambda: Position())
+    start: Position = field(default_factory=Position)
     """The ``start`` token defines the coordinates of the upper left corner of the line"""
 
-    end: Position = field(default_factory=lambda: Position())
+    end: Position = field(default_factory=Position)
     """The ``end`` token defines the coordinates of the low right corner of the line"""
 
     layer: str = "F.Cu"
@@ -185,23 +202,39 @@ class FpLine():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
-                else: continue
+                continue
 
-            if item[0] == 'start': object.start = Position.from_sexpr(item)
-            if item[0] == 'end': object.end = Position.from_sexpr(item)
-            if item[0] == 'layer': object.layer = item[1]
-            if item[0] == 'tstamp': object.tstamp = item[1]
-            if item[0] == 'width':
-                object.width = item[1]
-                object.stroke = None
-            if item[0] == 'stroke':
+            token = item[0]
+            if token == 'start': object.start = position_from_xy(item)
+            elif token == 'end': object.end = position_from_xy(item)
+            elif token == 'layer': object.layer = intern(item[1])
+            elif token == 'tstamp': object.tstamp = item[1]
+            elif token == 'stroke':
                 object.stroke = Stroke.from_sexpr(item)
                 object.width = None
+            elif token == 'width':
+                object.width = item[1]
+                object.stroke = None
 
         return object
 
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
+
+        Args:
+            - buf (StringIO): Buffer the S-Expression is written to
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+        """
+        indents = INDENTS[indent]
+        endline = '\n' if newline else ''
+        tstamp = f' (tstamp {self.tstamp})' if self.tstamp is not None else ''
+        width = width_or_stroke_token(self.width, self.stroke)
+
+        buf.write(f'{indents}(fp_line (start {self.start.X} {self.start.Y}) (end {self.end.X} {self.end.Y}) (layer "{dequote_layer(self.layer)}"){width}{tstamp}){endline}')
+
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
 
@@ -212,18 +245,11 @@ class FpLine():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
-        endline = '\n' if newline else ''
-        tstamp = f' (tstamp {self.tstamp})' if self.tstamp is not None else ''
-        if self.width is not None:
-            width = f' (width {self.width})'
-        elif self.stroke is not None:
-            width = f' {self.stroke.to_sexpr(indent=0, newline=False)}'
-        else:
-            width = ''
-
-        return f'{indents}(fp_line (start {self.start.X} {self.start.Y}) (end {self.end.X} {self.end.Y}) (layer "{dequote(self.layer)}"){width}{tstamp}){endline}'
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
 
+@add_slots
 @dataclass
 class FpRect():
     """The ``fp_rect`` token defines a graphic rectangle in a footprint definition.
@@ -232,10 +258,10 @@ class FpRect():
         https://dev-docs.kicad.org/en/file-formats/sexpr-intro/index.html#_footprint_rectangle
     """
 
-    start: Position = field(default_factory=lambda: Position())
+    start: Position = field(default_factory=Position)
     """The ``start`` token defines the coordinates of the upper left corner of the rectangle"""
 
-    end: Position = field(default_factory=lambda: Position())
+    end: Position = field(default_factory=Position)
     """The ``end`` token defines the coordinates of the low right corner of the rectangle"""
 
     layer: str = "F.Cu"
@@ -279,50 +305,59 @@ class FpRect():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
-                else: continue
-
-            if item[0] == 'start': object.start = Position.from_sexpr(item)
-            if item[0] == 'end': object.end = Position.from_sexpr(item)
-            if item[0] == 'layer': object.layer = item[1]
-            if item[0] == 'tstamp': object.tstamp = item[1]
-            if item[0] == 'fill': object.fill = item[1]
-            if item[0] == 'width':
-                object.width = item[1]
-                object.stroke = None
-            if item[0] == 'stroke':
+                continue
+
+            token = item[0]
+            if token == 'start': object.start = position_from_xy(item)
+            elif token == 'end': object.end = position_from_xy(item)
+            elif token == 'layer': object.layer = intern(item[1])
+            elif token == 'tstamp': object.tstamp = item[1]
+            elif token == 'stroke':
                 object.stroke = Stroke.from_sexpr(item)
                 object.width = None
+            elif token == 'width':
+                object.width = item[1]
+                object.stroke = None
+            elif token == 'fill': object.fill = intern(item[1])
 
         return object
 
-    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
 
         Args:
+            - buf (StringIO): Buffer the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         tstamp = f' (tstamp {self.tstamp})' if self.tstamp is not None else ''
         locked = ' locked' if self.locked else ''
         fill = f' (fill {self.fill})' if self.fill is not None else ''
 
-        if self.width is not None:
-            width = f' (width {self.width})'
-        elif self.stroke is not None:
-            width = f' {self.stroke.to_sexpr(indent=0, newline=False)}'
-        else:
-            width = ''
+        width = width_or_stroke_token(self.width, self.stroke)
+
+        buf.write(f'{indents}(fp_rect (start {self.start.X} {self.start.Y}) (end {self.end.X} {self.end.Y}) (layer "{dequote_layer(self.layer)}"){width}{fill}{locked}{tstamp}){endline}')
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object
 
-        return f'{indents}(fp_rect (start {self.start.X} {self.start.Y}) (end {self.end.X} {self.end.Y}) (layer "{dequote(self.layer)}"){width}{fill}{locked}{tstamp}){endline}'
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
 
+@add_slots
 @dataclass
 class FpTextBox():
     """The ``fp_text_box`` token defines a rectangle containing line-wrapped text.
@@ -409,24 +444,25 @@ class FpTextBox():
             start_at = 2
 
         for item in exp[start_at:]:
-            if item[0] == 'start': object.start = Position.from_sexpr(item)
-            if item[0] == 'end': object.end = Position.from_sexpr(item)
-            if item[0] == 'pts':
-                for point in item[1:]:
-                    object.pts.append(Position().from_sexpr(point))
-            if item[0] == 'angle': object.angle = item[1]
-            if item[0] == 'layer': object.layer = item[1]
-            if item[0] == 'tstamp': object.tstamp = item[1]
-            if item[0] == 'effects': object.effects = Effects.from_sexpr(item)
-            if item[0] == 'stroke': object.stroke = Stroke.from_sexpr(item)
-            if item[0] == 'render_cache': object.renderCache = RenderCache.from_sexpr(item)
+            if not isinstance(item, list): continue
+            token = item[0]
+            if token == 'start': object.start = position_from_xy(item)
+            elif token == 'end': object.end = position_from_xy(item)
+            elif token == 'pts': object.pts.extend([position_from_xy(point) for point in item[1:]])
+            elif token == 'angle': object.angle = item[1]
+            elif token == 'layer': object.layer = intern(item[1])
+            elif token == 'tstamp': object.tstamp = item[1]
+            elif token == 'effects': object.effects = Effects.from_sexpr(item)
+            elif token == 'stroke': object.stroke = Stroke.from_sexpr(item)
+            elif token == 'render_cache': object.renderCache = RenderCache.from_sexpr(item)
 
         return object
 
-    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
 
         Args:
+            - buf (StringIO): Buffer the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
 
@@ -435,9 +471,6 @@ class FpTextBox():
               the ``self.pts`` token
             - Exception: When a cardinal angle or no angle is given and either start or end token
               is undefined
-
-        Returns:
-            - str: S-Expression of this object
         """
         if self.angle is not None and self.angle not in [0.0, 90.0, 180.0, 270.0]:
             if len(self.pts) != 4:
@@ -446,7 +479,7 @@ class FpTextBox():
             if self.start is None or self.end is None:
                 raise Exception("No angle or a cardinal angle needs a start and end token defined")
 
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         tstamp = f' (tstamp {self.tstamp})' if self.tstamp is not None else ''
@@ -455,21 +488,42 @@ class FpTextBox():
         end = f'(end {self.end.X} {self.end.Y}) ' if self.end is not None else ''
         locked = ' locked' if self.locked else ''
 
-        expression = f'{indents}(fp_text_box{locked} "{dequote(self.text)}"\n'
+        buf.write(f'{indents}(fp_text_box{locked} "{dequote(self.text)}"\n')
         if len(self.pts) == 4:
-            expression += f'{indents}  (pts\n'
-            expression += f'{indents}    (xy {self.pts[0].X} {self.pts[0].Y})      (xy {self.pts[1].X} {self.pts[1].Y})      (xy {self.pts[2].X} {self.pts[2].Y})      (xy {self.pts[3].X} {self.pts[3].Y})\n'
-            expression += f'{indents}  )\n'
-        expression += f'{indents}  {start}{end}{angle}(layer "{dequote(self.layer)}"){tstamp}\n'
+            buf.write(f'{indents}  (pts\n')
+            p0, p1, p2, p3 = self.pts
+            buf.write(f'{indents}    (xy {p0.X} {p0.Y})      (xy {p1.X} {p1.Y})      (xy {p2.X} {p2.Y})      (xy {p3.X} {p3.Y})\n')
+            buf.write(f'{indents}  )\n')
+        buf.write(f'{indents}  {start}{end}{angle}(layer "{dequote_layer(self.layer)}"){tstamp}\n')
         if self.effects is not None:
-            expression += self.effects.to_sexpr(indent+2)
+            buf.write(self.effects.to_sexpr(indent+2))
         if self.stroke is not None:
-            expression += self.stroke.to_sexpr(indent+2)
+            buf.write(self.stroke.to_sexpr(indent+2))
         if self.renderCache is not None:
-            expression += self.renderCache.to_sexpr(indent+2)
-        expression += f'{indents}){endline}'
-        return expression
+            buf.write(self.renderCache.to_sexpr(indent+2))
+        buf.write(f'{indents}){endline}')
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+
+        Raises:
+            - Exception: When a non-cardinal angle is given and no corner points were defined using
+              the ``self.pts`` token
+            - Exception: When a cardinal angle or no angle is given and either start or end token
+              is undefined
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
 
+@add_slots
 @dataclass
 class FpCircle():
     """The ``fp_circle `` token defines a graphic circle in a footprint definition.
@@ -478,10 +532,10 @@ class FpCircle():
         https://dev-docs.kicad.org/en/file-formats/sexpr-intro/index.html#_footprint_circle
     """
 
-    center: Position = field(default_factory=lambda: Position())
+    center: Position = field(default_factory=Position)
     """The ``center`` token defines the coordinates of the center of the circle"""
 
-    end: Position = field(default_factory=lambda: Position())
+    end: Position = field(default_factory=Position)
     """The ``end`` token defines the coordinates of the low right corner of the circle"""
 
     layer: str = "F.Cu"
@@ -525,50 +579,59 @@ class FpCircle():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
-                else: continue
-
-            if item[0] == 'center': object.center = Position.from_sexpr(item)
-            if item[0] == 'end': object.end = Position.from_sexpr(item)
-            if item[0] == 'layer': object.layer = item[1]
-            if item[0] == 'tstamp': object.tstamp = item[1]
-            if item[0] == 'fill': object.fill = item[1]
-            if item[0] == 'width':
-                object.width = item[1]
-                object.stroke = None
-            if item[0] == 'stroke':
+                continue
+
+            token = item[0]
+            if token == 'center': object.center = position_from_xy(item)
+            elif token == 'end': object.end = position_from_xy(item)
+            elif token == 'layer': object.layer = intern(item[1])
+            elif token == 'tstamp': object.tstamp = item[1]
+            elif token == 'stroke':
                 object.stroke = Stroke.from_sexpr(item)
                 object.width = None
+            elif token == 'width':
+                object.width = item[1]
+                object.stroke = None
+            elif token == 'fill': object.fill = intern(item[1])
 
         return object
 
-    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
 
         Args:
+            - buf (StringIO): Buffer the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         tstamp = f' (tstamp {self.tstamp})' if self.tstamp is not None else ''
         locked = ' locked' if self.locked else ''
         fill = f' (fill {self.fill})' if self.fill is not None else ''
 
-        if self.width is not None:
-            width = f' (width {self.width})'
-        elif self.stroke is not None:
-            width = f' {self.stroke.to_sexpr(indent=0, newline=False)}'
-        else:
-            width = ''
+        width = width_or_stroke_token(self.width, self.stroke)
+
+        buf.write(f'{indents}(fp_circle (center {self.center.X} {self.center.Y}) (end {self.end.X} {self.end.Y}) (layer "{dequote_layer(self.layer)}"){width}{fill}{locked}{tstamp}){endline}')
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
 
-        return f'{indents}(fp_circle (center {self.center.X} {self.center.Y}) (end {self.end.X} {self.end.Y}) (layer "{dequote(self.layer)}"){width}{fill}{locked}{tstamp}){endline}'
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
 
+@add_slots
 @dataclass
 class FpArc():
     """The ``fp_arc`` token defines a graphic arc in a footprint definition.
@@ -577,13 +640,13 @@ class FpArc():
         https://dev-docs.kicad.org/en/file-formats/sexpr-intro/index.html#_footprint_arc
     """
 
-    start: Position = field(default_factory=lambda: Position())
+    start: Position = field(default_factory=Position)
     """The ``start`` token defines the coordinates of the start position of the arc radius"""
 
-    mid: Position = field(default_factory=lambda: Position())
+    mid: Position = field(default_factory=Position)
     """The ``mid`` token defines the coordinates of the midpoint along the arc"""
 
-    end: Position = field(default_factory=lambda: Position())
+    end: Position = field(default_factory=Position)
     """The ``end`` token defines the coordinates of the end position of the arc radius"""
 
     layer: str = "F.Cu"
@@ -623,49 +686,58 @@ class FpArc():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
-                else: continue
-
-            if item[0] == 'start': object.start = Position.from_sexpr(item)
-            if item[0] == 'mid': object.mid = Position.from_sexpr(item)
-            if item[0] == 'end': object.end = Position.from_sexpr(item)
-            if item[0] == 'layer': object.layer = item[1]
-            if item[0] == 'tstamp': object.tstamp = item[1]
-            if item[0] == 'width':
-                object.width = item[1]
-                object.stroke = None
-            if item[0] == 'stroke':
+                continue
+
+            token = item[0]
+            if token == 'start': object.start = position_from_xy(item)
+            elif token == 'mid': object.mid = position_from_xy(item)
+            elif token == 'end': object.end = position_from_xy(item)
+            elif token == 'layer': object.layer = intern(item[1])
+            elif token == 'tstamp': object.tstamp = item[1]
+            elif token == 'stroke':
                 object.stroke = Stroke.from_sexpr(item)
                 object.width = None
+            elif token == 'width':
+                object.width = item[1]
+                object.stroke = None
 
         return object
 
-    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
 
         Args:
+            - buf (StringIO): Buffer the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         tstamp = f' (tstamp {self.tstamp})' if self.tstamp is not None else ''
         locked = ' locked' if self.locked else ''
 
-        if self.width is not None:
-            width = f' (width {self.width})'
-        elif self.stroke is not None:
-            width = f' {self.stroke.to_sexpr(indent=0, newline=False)}'
-        else:
-            width = ''
+        width = width_or_stroke_token(self.width, self.stroke)
+
+        buf.write(f'{indents}(fp_arc (start {self.start.X} {self.start.Y}) (mid {self.mid.X} {self.mid.Y}) (end {self.end.X} {self.end.Y}) (layer "{dequote_layer(self.layer)}"){width}{locked}{tstamp}){endline}')
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
 
-        return f'{indents}(fp_arc (start {self.start.X} {self.start.Y}) (mid {self.mid.X} {self.mid.Y}) (end {self.end.X} {self.end.Y}) (layer "{dequote(self.layer)}"){width}{locked}{tstamp}){endline}'
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
 
+@add_slots
 @dataclass
 class FpPoly():
     """The ``fp_poly`` token defines a graphic polygon in a footprint definition.
@@ -719,25 +791,53 @@ class FpPoly():
         object = cls()
 
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
-                else: continue
-
-            if item[0] == 'pts':
-                for point in item[1:]:
-                    object.coordinates.append(Position().from_sexpr(point))
-            if item[0] == 'layer': object.layer = item[1]
-            if item[0] == 'tstamp': object.tstamp = item[1]
-            if item[0] == 'fill': object.fill = item[1]
-            if item[0] == 'width':
-                object.width = item[1]
-                object.stroke = None
-            if item[0] == 'stroke':
+                continue
+
+            token = item[0]
+            if token == 'pts':
+                object.coordinates.extend([position_from_xy(point) for point in item[1:]])
+            elif token == 'layer': object.layer = intern(item[1])
+            elif token == 'tstamp': object.tstamp = item[1]
+            elif token == 'stroke':
                 object.stroke = Stroke.from_sexpr(item)
                 object.width = None
+            elif token == 'width':
+                object.width = item[1]
+                object.stroke = None
+            elif token == 'fill': object.fill = intern(item[1])
 
         return object
 
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer. When no
+        coordinates are set in the polygon, the resulting S-Expression will be left empty.
+
+        Args:
+            - buf (StringIO): Buffer the S-Expression is written to
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+        """
+        indents = INDENTS[indent]
+        endline = '\n' if newline else ''
+        if len(self.coordinates) == 0:
+            buf.write(f'{indents}{endline}')
+            return
+
+        suffix_parts = [width_or_stroke_token(self.width, self.stroke)]
+        if self.fill is not None:
+            suffix_parts.append(f' (fill {self.fill})')
+        if self.locked:
+            suffix_parts.append(' locked')
+        if self.tstamp is not None:
+            suffix_parts.append(f' (tstamp {self.tstamp})')
+        suffix = ''.join(suffix_parts)
+
+        xy_prefix = f'{indents}    (xy '
+        points = ''.join([f'{xy_prefix}{point.X} {point.Y})\n' for point in self.coordinates])
+        buf.write(f'{indents}(fp_poly (pts\n{points}{indents}  ) (layer "{dequote_layer(self.layer)}"){suffix}){endline}')
+
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object. When no coordinates are set
         in the polygon, the resulting S-Expression will be left empty.
@@ -749,28 +849,11 @@ class FpPoly():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
-        endline = '\n' if newline else ''
-        if len(self.coordinates) == 0:
-            return f'{indents}{endline}'
-
-        tstamp = f' (tstamp {self.tstamp})' if self.tstamp is not None else ''
-        locked = ' locked' if self.locked else ''
-        fill = f' (fill {self.fill})' if self.fill is not None else ''
-
-        if self.width is not None:
-            width = f' (width {self.width})'
-        elif self.stroke is not None:
-            width = f' {self.stroke.to_sexpr(indent=0, newline=False)}'
-        else:
-            width = ''
-
-        expression = f'{indents}(fp_poly (pts\n'
-        for point in self.coordinates:
-            expression += f'{indents}    (xy {point.X} {point.Y})\n'
-        expression += f'{indents}  ) (layer "{dequote(self.layer)}"){width}{fill}{locked}{tstamp}){endline}'
-        return expression
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
 
+@add_slots
 @dataclass
 class FpCurve():
     """The ``fp_curve`` token defines a graphic Cubic Bezier curve in a footprint definition.
@@ -819,24 +902,50 @@ class FpCurve():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
-                else: continue
-
-            if item[0] == 'pts':
-                for point in item[1:]:
-                    object.coordinates.append(Position().from_sexpr(point))
-            if item[0] == 'layer': object.layer = item[1]
-            if item[0] == 'tstamp': object.tstamp = item[1]
-            if item[0] == 'width':
-                object.width = item[1]
-                object.stroke = None
-            if item[0] == 'stroke':
+                continue
+
+            token = item[0]
+            if token == 'pts':
+                object.coordinates.extend([position_from_xy(point) for point in item[1:]])
+            elif token == 'layer': object.layer = intern(item[1])
+            elif token == 'tstamp': object.tstamp = item[1]
+            elif token == 'stroke':
                 object.stroke = Stroke.from_sexpr(item)
                 object.width = None
+            elif token == 'width':
+                object.width = item[1]
+                object.stroke = None
 
         return object
 
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer. When no
+        coordinates are set in the curve, the resulting S-Expression will be left empty.
+
+        Args:
+            - buf (StringIO): Buffer the S-Expression is written to
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+        """
+        indents = INDENTS[indent]
+        endline = '\n' if newline else ''
+        if len(self.coordinates) == 0:
+            buf.write(f'{indents}{endline}')
+            return
+
+        suffix_parts = [width_or_stroke_token(self.width, self.stroke)]
+        if self.locked:
+            suffix_parts.append(' locked')
+        if self.tstamp is not None:
+            suffix_parts.append(f' (tstamp {self.tstamp})')
+        suffix = ''.join(suffix_parts)
+
+        xy_prefix = f'{indents}  (xy '
+        points = ''.join([f'{xy_prefix}{point.X} {point.Y})\n' for point in self.coordinates])
+        buf.write(f'{indents}(fp_curve (pts\n{points}{indents}) (layer "{dequote_layer(self.layer)}"){suffix}){endline}')
+
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object. When no coordinates are set
         in the curve, the resulting S-Expression will be left empty.
@@ -848,23 +957,6 @@ class FpCurve():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
-        endline = '\n' if newline else ''
-        if len(self.coordinates) == 0:
-            return f'{indents}{endline}'
-
-        tstamp = f' (tstamp {self.tstamp})' if self.tstamp is not None else ''
-        locked = ' locked' if self.locked else ''
-
-        if self.width is not None:
-            width = f' (width {self.width})'
-        elif self.stroke is not None:
-            width = f' {self.stroke.to_sexpr(indent=0, newline=False)}'
-        else:
-            width = ''
-
-        expression = f'{indents}(fp_curve (pts\n'
-        for point in self.coordinates:
-            expression += f'{indents}  (xy {point.X} {point.Y})\n'
-        expression += f'{indents}) (layer "{dequote(self.layer)}"){width}{locked}{tstamp}){endline}'
-        return expression
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
@@ -18,11 +18,15 @@ Documentation taken from:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from io import StringIO
+from sys import intern
 from typing import Optional, List
 
-from kiutils.items.common import Effects, Position, RenderCache, Stroke
-from kiutils.utils.strings import dequote
+from kiutils.items.common import Effects, Position, RenderCache, Stroke, position_from_xy
+from kiutils.utils.slots import add_slots
+from kiutils.utils.strings import dequote, dequote_layer, fill_token, layer_token, width_token, INDENTS
 
+@add_slots
 @dataclass
 class GrText():
     """The ``gr_text`` token defines a graphical text.
@@ -38,14 +42,14 @@ class GrText():
     """The ``knockout`` token defines if the text is inverted (means transparent text and colored
     background insted of colored text and transparent background)"""
 
-    position: Position = field(default_factory=lambda: Position())
+    position: Position = field(default_factory=Position)
     """The ``position`` defines the X and Y position coordinates and optional orientation angle of 
     the text"""
 
     layer: Optional[str] = None
     """The ``layer`` token defines the canonical layer the text resides on"""
 
-    effects: Effects = field(default_factory=lambda: Effects())
+    effects: Effects = field(default_factory=Effects)
     """The ``effects`` token defines how the text is displayed"""
 
     tstamp: Optional[str] = None      # Used since KiCad 6
@@ -83,46 +87,59 @@ class GrText():
         object = cls()
         object.text = exp[1]
         for item in exp[2:]:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
                 continue
-            if item[0] == 'at': object.position = Position().from_sexpr(item)
-            if item[0] == 'layer': 
-                object.layer = item[1]
+            token = item[0]
+            if token == 'at': object.position = Position.from_sexpr(item)
+            elif token == 'layer': 
+                object.layer = intern(item[1])
                 if(len(item) > 2):
                     if(item[2] == "knockout"):
                         object.knockout = True
-            if item[0] == 'effects': object.effects = Effects().from_sexpr(item)
-            if item[0] == 'tstamp': object.tstamp = item[1]
-            if item[0] == 'render_cache': object.renderCache = RenderCache.from_sexpr(item)
+            elif token == 'effects': object.effects = Effects.from_sexpr(item)
+            elif token == 'tstamp': object.tstamp = item[1]
+            elif token == 'render_cache': object.renderCache = RenderCache.from_sexpr(item)
         return object
 
-    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
 
         Args:
+            - buf (StringIO): Buffer the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         ko = ' knockout' if self.knockout else ''
         posA = f' {self.position.angle}' if self.position.angle is not None else ''
-        layer =  f' (layer "{dequote(self.layer)}"{ko})' if self.layer is not None else ''
+        layer =  f' (layer "{dequote_layer(self.layer)}"{ko})' if self.layer is not None else ''
         tstamp = f' (tstamp {self.tstamp})' if self.tstamp is not None else ''
         locked = f' locked' if self.locked else ''
 
-        expression =  f'{indents}(gr_text{locked} "{dequote(self.text)}" (at {self.position.X} {self.position.Y}{posA}){layer}{tstamp}\n'
-        expression += f'{indents}  {self.effects.to_sexpr()}'
+        buf.write(f'{indents}(gr_text{locked} "{dequote(self.text)}" (at {self.position.X} {self.position.Y}{posA}){layer}{tstamp}\n')
+        buf.write(f'{indents}  {self.effects.to_sexpr()}')
         if self.renderCache is not None:
-            expression += self.renderCache.to_sexpr(indent+2)
-        expression += f'{indents}){endline}'
-        return expression
+            buf.write(self.renderCache.to_sexpr(indent+2))
+        buf.write(f'{indents}){endline}')
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
 
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
+
+@add_slots
 @dataclass
 class GrTextBox():
     """The ``gr_text_box`` token defines a graphical rectangle containing line-wrapped text.
@@ -211,24 +228,25 @@ class GrTextBox():
             start_at = 2
 
         for item in exp[start_at:]:
-            if item[0] == 'start': object.start = Position.from_sexpr(item)
-            if item[0] == 'end': object.end = Position.from_sexpr(item)
-            if item[0] == 'pts':
-                for point in item[1:]:
-                    object.pts.append(Position().from_sexpr(point))
-            if item[0] == 'angle': object.angle = item[1]
-            if item[0] == 'layer': object.layer = item[1]
-            if item[0] == 'tstamp': object.tstamp = item[1]
-            if item[0] == 'effects': object.effects = Effects.from_sexpr(item)
-            if item[0] == 'stroke': object.stroke = Stroke.from_sexpr(item)
-            if item[0] == 'render_cache': object.renderCache = RenderCache.from_sexpr(item)
+            if not isinstance(item, list): continue
+            token = item[0]
+            if token == 'start': object.start = position_from_xy(item)
+            elif token == 'end': object.end = position_from_xy(item)
+            elif token == 'pts': object.pts.extend([position_from_xy(point) for point in item[1:]])
+            elif token == 'angle': object.angle = item[1]
+            elif token == 'layer': object.layer = intern(item[1])
+            elif token == 'tstamp': object.tstamp = item[1]
+            elif token == 'effects': object.effects = Effects.from_sexpr(item)
+            elif token == 'stroke': object.stroke = Stroke.from_sexpr(item)
+            elif token == 'render_cache': object.renderCache = RenderCache.from_sexpr(item)
 
         return object
 
-    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
 
         Args:
+            - buf (StringIO): Buffer the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
 
@@ -237,9 +255,6 @@ class GrTextBox():
               the ``self.pts`` token
             - Exception: When a cardinal angle or no angle is given and either start or end token
               is undefined
-
-        Returns:
-            - str: S-Expression of this object
         """
         if self.angle is not None and self.angle not in [0.0, 90.0, 180.0, 270.0]:
             if len(self.pts) != 4:
@@ -248,7 +263,7 @@ class GrTextBox():
             if self.start is None or self.end is None:
                 raise Exception("No angle or a cardinal angle needs a start and end token defined")
 
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         tstamp = f' (tstamp {self.tstamp})' if self.tstamp is not None else ''
@@ -257,21 +272,41 @@ class GrTextBox():
         end = f'(end {self.end.X} {self.end.Y}) ' if self.end is not None else ''
         locked = ' locked' if self.locked else ''
 
-        expression = f'{indents}(gr_text_box{locked} "{dequote(self.text)}"\n'
+        buf.write(f'{indents}(gr_text_box{locked} "{dequote(self.text)}"\n')
         if len(self.pts) == 4:
-            expression += f'{indents}  (pts\n'
-            expression += f'{indents}    (xy {self.pts[0].X} {self.pts[0].Y})        (xy {self.pts[1].X} {self.pts[1].Y})        (xy {self.pts[2].X} {self.pts[2].Y})        (xy {self.pts[3].X} {self.pts[3].Y})\n'
-            expression += f'{indents}  )\n'
-        expression += f'{indents}  {start}{end}{angle}(layer "{dequote(self.layer)}"){tstamp}\n'
+            buf.write(f'{indents}  (pts\n')
+            buf.write(f'{indents}    (xy {self.pts[0].X} {self.pts[0].Y})        (xy {self.pts[1].X} {self.pts[1].Y})        (xy {self.pts[2].X} {self.pts[2].Y})        (xy {self.pts[3].X} {self.pts[3].Y})\n')
+            buf.write(f'{indents}  )\n')
+        buf.write(f'{indents}  {start}{end}{angle}(layer "{dequote_layer(self.layer)}"){tstamp}\n')
         if self.effects is not None:
-            expression += self.effects.to_sexpr(indent+2)
+            buf.write(self.effects.to_sexpr(indent+2))
         if self.stroke is not None:
-            expression += self.stroke.to_sexpr(indent+2)
+            buf.write(self.stroke.to_sexpr(indent+2))
         if self.renderCache is not None:
-            expression += self.renderCache.to_sexpr(indent+2)
-        expression += f'{indents}){endline}'
-        return expression
+            buf.write(self.renderCache.to_sexpr(indent+2))
+        buf.write(f'{indents}){endline}')
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
 
+        Raises:
+            - Exception: When a non-cardinal angle is given and no corner points were defined using
+              the ``self.pts`` token
+            - Exception: When a cardinal angle or no angle is given and either start or end token
+              is undefined
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
+
+@add_slots
 @dataclass
 class GrLine():
     """The ``gr_line`` token defines a graphical line.
@@ -280,10 +315,10 @@ class GrLine():
         https://dev-docs.kicad.org/en/file-formats/sexpr-intro/index.html#_graphical_line
     """
 
-    start: Position = field(default_factory=lambda: Position())
+    start: Position = field(default_factory=Position)
     """The ``start`` token defines the coordinates of the start of the line"""
 
-    end: Position = field(default_factory=lambda: Position())
+    end: Position = field(default_factory=Position)
     """The ``end`` token defines the coordinates of the end of the line"""
 
     angle: Optional[float] = None
@@ -323,36 +358,50 @@ class GrLine():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
                 continue
-            if item[0] == 'start': object.start = Position.from_sexpr(item)
-            if item[0] == 'end': object.end = Position.from_sexpr(item)
-            if item[0] == 'layer': object.layer = item[1]
-            if item[0] == 'tstamp': object.tstamp = item[1]
-            if item[0] == 'width': object.width = item[1]
+            token = item[0]
+            if token == 'start': object.start = position_from_xy(item)
+            elif token == 'end': object.end = position_from_xy(item)
+            elif token == 'layer': object.layer = intern(item[1])
+            elif token == 'width': object.width = item[1]
+            elif token == 'tstamp': object.tstamp = item[1]
         return object
 
-    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
 
         Args:
+            - buf (StringIO): Buffer the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
         locked = f' locked' if self.locked else ''
 
         tstamp = f' (tstamp {self.tstamp})' if self.tstamp is not None else ''
-        layer =  f' (layer "{dequote(self.layer)}")' if self.layer is not None else ''
+        layer = layer_token(self.layer)
         angle = f' (angle {self.angle}' if self.angle is not None else ''
 
-        return f'{indents}(gr_line{locked} (start {self.start.X} {self.start.Y}) (end {self.end.X} {self.end.Y}){angle}{layer} (width {self.width}){tstamp}){endline}'
+        buf.write(f'{indents}(gr_line{locked} (start {self.start.X} {self.start.Y}) (end {self.end.X} {self.end.Y}){angle}{layer}{width_token(self.width)}{tstamp}){endline}')
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
 
+@add_slots
 @dataclass
 class GrRect():
     """The ``gr_rect`` token defines a graphical rectangle.
@@ -361,10 +410,10 @@ class GrRect():
         https://dev-docs.kicad.org/en/file-formats/sexpr-intro/index.html#_graphical_rectangle
     """
 
-    start: Position = field(default_factory=lambda: Position())
+    start: Position = field(default_factory=Position)
     """The ``start`` token defines the coordinates of the upper left corner of the rectangle"""
 
-    end: Position = field(default_factory=lambda: Position())
+    end: Position = field(default_factory=Position)
     """The ``end`` token defines the coordinates of the low right corner of the rectangle"""
 
     layer: Optional[str] = None
@@ -404,37 +453,51 @@ class GrRect():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
                 continue
-            if item[0] == 'start': object.start = Position.from_sexpr(item)
-            if item[0] == 'end': object.end = Position.from_sexpr(item)
-            if item[0] == 'layer': object.layer = item[1]
-            if item[0] == 'tstamp': object.tstamp = item[1]
-            if item[0] == 'fill': object.fill = item[1]
-            if item[0] == 'width': object.width = item[1]
+            token = item[0]
+            if token == 'start': object.start = position_from_xy(item)
+            elif token == 'end': object.end = position_from_xy(item)
+            elif token == 'layer': object.layer = intern(item[1])
+            elif token == 'width': object.width = item[1]
+            elif token == 'fill': object.fill = intern(item[1])
+            elif token == 'tstamp': object.tstamp = item[1]
         return object
 
-    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
 
         Args:
+            - buf (StringIO): Buffer the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
         locked = f' locked' if self.locked else ''
 
         tstamp = f' (tstamp {self.tstamp})' if self.tstamp is not None else ''
-        layer =  f' (layer "{dequote(self.layer)}")' if self.layer is not None else ''
-        fill = f' (fill {self.fill})' if self.fill is not None else ''
+        layer = layer_token(self.layer)
+        fill = fill_token(self.fill)
 
-        return f'{indents}(gr_rect{locked} (start {self.start.X} {self.start.Y}) (end {self.end.X} {self.end.Y}){layer} (width {self.width}){fill}{tstamp}){endline}'
+        buf.write(f'{indents}(gr_rect{locked} (start {self.start.X} {self.start.Y}) (end {self.end.X} {self.end.Y}){layer}{width_token(self.width)}{fill}{tstamp}){endline}')
 
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
+
+@add_slots
 @dataclass
 class GrCircle():
     """The ``gr_circle `` token defines a graphical circle.
@@ -443,10 +506,10 @@ class GrCircle():
         https://dev-docs.kicad.org/en/file-formats/sexpr-intro/index.html#_graphical_circle
     """
 
-    center: Position = field(default_factory=lambda: Position())
+    center: Position = field(default_factory=Position)
     """The ``center`` token defines the coordinates of the center of the circle"""
 
-    end: Position = field(default_factory=lambda: Position())
+    end: Position = field(default_factory=Position)
     """The ``end`` token defines the coordinates of the low right corner of the circle"""
 
     layer: Optional[str] = None
@@ -486,38 +549,52 @@ class GrCircle():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
                 continue
-            if item[0] == 'center': object.center = Position.from_sexpr(item)
-            if item[0] == 'end': object.end = Position.from_sexpr(item)
-            if item[0] == 'layer': object.layer = item[1]
-            if item[0] == 'tstamp': object.tstamp = item[1]
-            if item[0] == 'fill': object.fill = item[1]
-            if item[0] == 'width': object.width = item[1]
+            token = item[0]
+            if token == 'center': object.center = position_from_xy(item)
+            elif token == 'end': object.end = position_from_xy(item)
+            elif token == 'layer': object.layer = intern(item[1])
+            elif token == 'width': object.width = item[1]
+            elif token == 'fill': object.fill = intern(item[1])
+            elif token == 'tstamp': object.tstamp = item[1]
 
         return object
 
-    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
 
         Args:
+            - buf (StringIO): Buffer the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
         locked = f' locked' if self.locked else ''
 
         tstamp = f' (tstamp {self.tstamp})' if self.tstamp is not None else ''
-        layer =  f' (layer "{dequote(self.layer)}")' if self.layer is not None else ''
-        fill = f' (fill {self.fill})' if self.fill is not None else ''
+        layer = layer_token(self.layer)
+        fill = fill_token(self.fill)
+
+        buf.write(f'{indents}(gr_circle{locked} (center {self.center.X} {self.center.Y}) (end {self.end.X} {self.end.Y}){layer}{width_token(self.width)}{fill}{tstamp}){endline}')
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
 
-        return f'{indents}(gr_circle{locked} (center {self.center.X} {self.center.Y}) (end {self.end.X} {self.end.Y}){layer} (width {self.width}){fill}{tstamp}){endline}'
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
 
+@add_slots
 @dataclass
 class GrArc():
     """The ``gr_arc`` token defines a graphic arc.
@@ -526,13 +603,13 @@ class GrArc():
         https://dev-docs.kicad.org/en/file-formats/sexpr-intro/index.html#_graphical_arc
     """
 
-    start: Position = field(default_factory=lambda: Position())
+    start: Position = field(default_factory=Position)
     """The ``start`` token defines the coordinates of the start position of the arc radius"""
 
-    mid: Position = field(default_factory=lambda: Position())
+    mid: Position = field(default_factory=Position)
     """The ``mid`` token defines the coordinates of the midpoint along the arc"""
 
-    end: Position = field(default_factory=lambda: Position())
+    end: Position = field(default_factory=Position)
     """The ``end`` token defines the coordinates of the end position of the arc radius"""
 
     layer: Optional[str] = None
@@ -569,37 +646,51 @@ class GrArc():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
                 continue
-            if item[0] == 'start': object.start = Position.from_sexpr(item)
-            if item[0] == 'mid': object.mid = Position.from_sexpr(item)
-            if item[0] == 'end': object.end = Position.from_sexpr(item)
-            if item[0] == 'layer': object.layer = item[1]
-            if item[0] == 'tstamp': object.tstamp = item[1]
-            if item[0] == 'width': object.width = item[1]
+            token = item[0]
+            if token == 'start': object.start = position_from_xy(item)
+            elif token == 'mid': object.mid = position_from_xy(item)
+            elif token == 'end': object.end = position_from_xy(item)
+            elif token == 'layer': object.layer = intern(item[1])
+            elif token == 'width': object.width = item[1]
+            elif token == 'tstamp': object.tstamp = item[1]
 
         return object
 
-    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
 
         Args:
+            - buf (StringIO): Buffer the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
         locked = f' locked' if self.locked else ''
 
         tstamp = f' (tstamp {self.tstamp})' if self.tstamp is not None else ''
-        layer =  f' (layer "{dequote(self.layer)}")' if self.layer is not None else ''
+        layer = layer_token(self.layer)
+
+        buf.write(f'{indents}(gr_arc{locked} (start {self.start.X} {self.start.Y}) (mid {self.mid.X} {self.mid.Y}) (end {self.end.X} {self.end.Y}){layer}{width_token(self.width)}{tstamp}){endline}')
 
-        return f'{indents}(gr_arc{locked} (start {self.start.X} {self.start.Y}) (mid {self.mid.X} {self.mid.Y}) (end {self.end.X} {self.end.Y}){layer} (width {self.width}){tstamp}){endline}'
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
 
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
+
+@add_slots
 @dataclass
 class GrPoly():
     """The ``gr_poly`` token defines a graphic polygon in a footprint definition.
@@ -649,54 +740,69 @@ class GrPoly():
         object = cls()
 
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
                 continue
-            if item[0] == 'pts':
-                for point in item[1:]:
-                    object.coordinates.append(Position().from_sexpr(point))
-            if item[0] == 'layer': object.layer = item[1]
-            if item[0] == 'tstamp': object.tstamp = item[1]
-            if item[0] == 'fill': object.fill = item[1]
-            if item[0] == 'width': object.width = item[1]
+            token = item[0]
+            if token == 'pts':
+                object.coordinates.extend([position_from_xy(point) for point in item[1:]])
+            elif token == 'layer': object.layer = intern(item[1])
+            elif token == 'width': object.width = item[1]
+            elif token == 'fill': object.fill = intern(item[1])
+            elif token == 'tstamp': object.tstamp = item[1]
 
         return object
 
-    def to_sexpr(self, indent: int = 2, newline: bool = True, pts_newline: bool = False) -> str:
-        """Generate the S-Expression representing this object. When no coordinates are set
-        in the polygon, the resulting S-Expression will be left empty.
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True, pts_newline: bool = False) -> None:
+        """Write the S-Expression representing this object into the given buffer. When no
+        coordinates are set in the polygon, the resulting S-Expression will be left empty.
 
         Args:
+            - buf (StringIO): Buffer the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
             - pts_newline (bool): Adds a newline for the ``(pts ..)`` token as KiCad treats
                                   this different in Board files than Footprint files. Defaults to 
                                   False.
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
         if len(self.coordinates) == 0:
-            return f'{indents}{endline}'
+            buf.write(f'{indents}{endline}')
+            return
 
         tstamp = f' (tstamp {self.tstamp})' if self.tstamp is not None else ''
-        layer =  f' (layer "{dequote(self.layer)}")' if self.layer is not None else ''
-        fill = f' (fill {self.fill})' if self.fill is not None else ''
+        layer = layer_token(self.layer)
+        fill = fill_token(self.fill)
         locked = f' locked' if self.locked else ''
 
         if pts_newline:
-            expression =  f'{indents}(gr_poly{locked}\n'
-            expression += f'{indents}  (pts\n'
+            buf.write(f'{indents}(gr_poly{locked}\n{indents}  (pts\n')
         else:
-            expression =  f'{indents}(gr_poly{locked} (pts\n'
+            buf.write(f'{indents}(gr_poly{locked} (pts\n')
+
+        points = ''.join([f'{indents}    (xy {point.X} {point.Y})\n' for point in self.coordinates])
+        buf.write(f'{points}{indents}  ){layer}{width_token(self.width)}{fill}{tstamp}){endline}')
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True, pts_newline: bool = False) -> str:
+        """Generate the S-Expression representing this object. When no coordinates are set
+        in the polygon, the resulting S-Expression will be left empty.
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+            - pts_newline (bool): Adds a newline for the ``(pts ..)`` token as KiCad treats
+                                  this different in Board files than Footprint files. Defaults to 
+                                  False.
 
-        for point in self.coordinates:
-            expression += f'{indents}    (xy {point.X} {point.Y})\n'
-        expression += f'{indents}  ){layer} (width {self.width}){fill}{tstamp}){endline}'
-        return expression
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline, pts_newline)
+        return buf.getvalue()
 
+@add_slots
 @dataclass
 class GrCurve():
     """The ``gr_curve`` token defines a graphic Cubic Bezier curve in a footprint definition.
@@ -741,40 +847,51 @@ class GrCurve():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
                 continue
-            if item[0] == 'pts':
-                for point in item[1:]:
-                    object.coordinates.append(Position().from_sexpr(point))
-            if item[0] == 'layer': object.layer = item[1]
-            if item[0] == 'tstamp': object.tstamp = item[1]
-            if item[0] == 'width': object.width = item[1]
+            token = item[0]
+            if token == 'pts':
+                object.coordinates.extend([position_from_xy(point) for point in item[1:]])
+            elif token == 'layer': object.layer = intern(item[1])
+            elif token == 'width': object.width = item[1]
+            elif token == 'tstamp': object.tstamp = item[1]
 
         return object
 
-    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
-        """Generate the S-Expression representing this object. When no coordinates are set
-        in the curve, the resulting S-Expression will be left empty.
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer. When no
+        coordinates are set in the curve, the resulting S-Expression will be left empty.
 
         Args:
+            - buf (StringIO): Buffer the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
         if len(self.coordinates) == 0:
-            return f'{indents}{endline}'
+            buf.write(f'{indents}{endline}')
+            return
 
         tstamp = f' (tstamp {self.tstamp})' if self.tstamp is not None else ''
-        layer =  f' (layer "{dequote(self.layer)}")' if self.layer is not None else ''
+        layer = layer_token(self.layer)
         locked = f' locked' if self.locked else ''
 
-        expression = f'{indents}(gr_curve{locked} (pts\n'
-        for point in self.coordinates:
-            expression += f'{indents}  (xy {point.X} {point.Y})\n'
-        expression += f'{indents}){layer} (width {self.width}){tstamp}){endline}'
-        return expression
+        points = ''.join([f'{indents}  (xy {point.X} {point.Y})\n' for point in self.coordinates])
+        buf.write(f'{indents}(gr_curve{locked} (pts\n{points}{indents}){layer}{width_token(self.width)}{tstamp}){endline}')
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object. When no coordinates are set
+        in the curve, the resulting S-Expression will be left empty.
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
@@ -17,11 +17,23 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
+from io import StringIO
 from typing import Optional, List, Dict
 
 from kiutils.items.common import Fill, Position, ColorRGBA, ProjectInstance, Stroke, Effects, Property
-from kiutils.utils.strings import dequote
+from kiutils.utils.slots import add_slots
+from kiutils.utils.strings import dequote, INDENTS
 
+_LIB_ID_RE = re.compile(r"^(.+?):(.+?)$")
+"""Pattern splitting a ``lib_id`` into its library nickname and entry name"""
+
+_SHEET_NAME_KEYS = frozenset(('Sheet name', 'Sheetname'))
+"""Property keys of the sheet name property of a hierarchical sheet"""
+
+_SHEET_FILE_KEYS = frozenset(('Sheet file', 'Sheetfile'))
+"""Property keys of the sheet file property of a hierarchical sheet"""
+
+@add_slots
 @dataclass
 class Junction():
     """The ``junction`` token defines a junction in the schematic
@@ -30,14 +42,14 @@ class Junction():
         https://dev-docs.kicad.org/en/file-formats/sexpr-schematic/#_junction_section
     """
 
-    position: Position = field(default_factory=lambda: Position())
+    position: Position = field(default_factory=Position)
     """The ``position`` defines the X and Y coordinates of the junction"""
 
     diameter: float = 0
     """The ``diameter`` token attribute defines the DIAMETER of the junction. A diameter of 0
        is the default diameter in the system settings."""
 
-    color: ColorRGBA = field(default_factory=lambda: ColorRGBA())
+    color: ColorRGBA = field(default_factory=ColorRGBA)
     """The ``color`` token attributes define the Red, Green, Blue, and Alpha transparency of
        the junction. If all four attributes are 0, the default junction color is used."""
 
@@ -66,10 +78,11 @@ class Junction():
 
         object = cls()
         for item in exp:
-            if item[0] == 'at': object.position = Position().from_sexpr(item)
-            if item[0] == 'color': object.color = ColorRGBA().from_sexpr(item)
-            if item[0] == 'diameter': object.color = item[1]
-            if item[0] == 'uuid': object.uuid = item[1]
+            token = item[0]
+            if token == 'at': object.position = Position.from_sexpr(item)
+            elif token == 'color': object.color = ColorRGBA.from_sexpr(item)
+            elif token == 'diameter': object.diameter = item[1]
+            elif token == 'uuid': object.uuid = item[1]
         return object
 
     def to_sexpr(self, indent=2, newline=True) -> str:
@@ -82,12 +95,13 @@ class Junction():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
         uuid = f'\n{indents}  (uuid {self.uuid})\n' if self.uuid is not None else ''
         expression =  f'{indents}(junction (at {self.position.X} {self.position.Y}) (diameter {self.diameter}) {self.color.to_sexpr()}{uuid}{indents}){endline}'
         return expression
 
+@add_slots
 @dataclass
 class NoConnect():
     """The ``no_connect`` token defines a unused pin connection in the schematic
@@ -96,7 +110,7 @@ class NoConnect():
         https://dev-docs.kicad.org/en/file-formats/sexpr-schematic/#_no_connect_section
     """
 
-    position: Position = field(default_factory=lambda: Position())
+    position: Position = field(default_factory=Position)
     """The ``position`` defines the X and Y coordinates of the no connect"""
 
     uuid: Optional[str] = None
@@ -124,8 +138,9 @@ class NoConnect():
 
         object = cls()
         for item in exp:
-            if item[0] == 'at': object.position = Position().from_sexpr(item)
-            if item[0] == 'uuid': object.uuid = item[1]
+            token = item[0]
+            if token == 'at': object.position = Position.from_sexpr(item)
+            elif token == 'uuid': object.uuid = item[1]
         return object
 
     def to_sexpr(self, indent=2, newline=True) -> str:
@@ -138,12 +153,13 @@ class NoConnect():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
         uuid = f' (uuid {self.uuid})' if self.uuid is not None else ''
 
         return f'{indents}(no_connect (at {self.position.X} {self.position.Y}){uuid}){endline}'
 
+@add_slots
 @dataclass
 class BusEntry():
     """The ``bus_entry`` token defines a bus entry in the schematic
@@ -152,17 +168,17 @@ class BusEntry():
         https://dev-docs.kicad.org/en/file-formats/sexpr-schematic/#_bus_entry_section
     """
 
-    position: Position = field(default_factory=lambda: Position())
+    position: Position = field(default_factory=Position)
     """The ``position`` defines the X and Y coordinates of the bus entry"""
 
     uuid: Optional[str] = None
     """The optional ``uuid`` defines the universally unique identifier. Defaults to ``None.``"""
 
-    size: Position = field(default_factory=lambda: Position())         # Re-using Position class here
+    size: Position = field(default_factory=Position)         # Re-using Position class here
     """The ``size`` token attributes define the X and Y distance of the end point from
        the position of the bus entry"""
 
-    stroke: Stroke = field(default_factory=lambda: Stroke())
+    stroke: Stroke = field(default_factory=Stroke)
     """The ``stroke`` defines how the bus entry is drawn"""
 
     @classmethod
@@ -187,10 +203,11 @@ class BusEntry():
 
         object = cls()
         for item in exp:
-            if item[0] == 'at': object.position = Position().from_sexpr(item)
-            if item[0] == 'stroke': object.stroke = Stroke().from_sexpr(item)
-            if item[0] == 'size': object.size = Position().from_sexpr(item)
-            if item[0] == 'uuid': object.uuid = item[1]
+            token = item[0]
+            if token == 'at': object.position = Position.from_sexpr(item)
+            elif token == 'stroke': object.stroke = Stroke.from_sexpr(item)
+            elif token == 'size': object.size = Position.from_sexpr(item)
+            elif token == 'uuid': object.uuid = item[1]
         return object
 
     def to_sexpr(self, indent=2, newline=True) -> str:
@@ -203,7 +220,7 @@ class BusEntry():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         expression =  f'{indents}(bus_entry (at {self.position.X} {self.position.Y}) (size {self.size.X} {self.size.Y})\n'
@@ -213,6 +230,7 @@ class BusEntry():
         expression += f'{indents}){endline}'
         return expression
 
+@add_slots
 @dataclass
 class BusAlias():
     """The ``bus_alias`` token defines a bus entry in the schematic
@@ -271,13 +289,14 @@ class BusAlias():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         members = [f'"{dequote(member)}"' for member in self.members]
         expression =  f'{indents}(bus_alias "{dequote(self.name)}" (members {" ".join(members)})){endline}'
         return expression
 
+@add_slots
 @dataclass
 class Connection():
     """The ``wire`` and ``bus`` tokens define wires and buses in the schematic
@@ -293,7 +312,7 @@ class Connection():
     """The ``points`` token defines the list of X and Y coordinates of start and end points
        of the wire or bus"""
 
-    stroke: Stroke = field(default_factory=lambda: Stroke())
+    stroke: Stroke = field(default_factory=Stroke)
     """The ``stroke`` defines how the connection is drawn"""
 
     uuid: Optional[str] = None
@@ -322,37 +341,47 @@ class Connection():
         object = cls()
         object.type = exp[0]
         for item in exp:
-            if item[0] == 'pts':
-                for point in item[1:]:
-                    object.points.append(Position().from_sexpr(point))
-            if item[0] == 'stroke': object.stroke = Stroke().from_sexpr(item)
-            if item[0] == 'uuid': object.uuid = item[1]
+            token = item[0]
+            if token == 'pts':
+                object.points.extend([Position.from_sexpr(point) for point in item[1:]])
+            elif token == 'stroke': object.stroke = Stroke.from_sexpr(item)
+            elif token == 'uuid': object.uuid = item[1]
         return object
 
-    def to_sexpr(self, indent=2, newline=True) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
 
         Args:
+            - buf (StringIO): Buffer the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
-        points = ''
-        for point in self.points:
-            points += f' (xy {point.X} {point.Y})'
+        points = ''.join([f' (xy {point.X} {point.Y})' for point in self.points])
 
-        expression =  f'{indents}({self.type} (pts{points})\n'
-        expression += self.stroke.to_sexpr(indent+2)
+        buf.write(f'{indents}({self.type} (pts{points})\n')
+        buf.write(self.stroke.to_sexpr(indent+2))
         if self.uuid is not None:
-            expression += f'{indents}  (uuid {self.uuid})\n'
-        expression += f'{indents}){endline}'
-        return expression
+            buf.write(f'{indents}  (uuid {self.uuid})\n')
+        buf.write(f'{indents}){endline}')
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object
 
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
+
+@add_slots
 @dataclass
 class PolyLine():
     """The ``polyline`` token defines one or more lines that may or may not represent a polygon
@@ -365,7 +394,7 @@ class PolyLine():
     """The ``points`` token defines the list of X/Y coordinates of to draw line(s)
        between. A minimum of two points is required."""
 
-    stroke: Stroke = field(default_factory=lambda: Stroke())
+    stroke: Stroke = field(default_factory=Stroke)
     """The ``stroke`` defines how the graphical line is drawn"""
 
     uuid: Optional[str] = None
@@ -393,37 +422,47 @@ class PolyLine():
 
         object = cls()
         for item in exp:
-            if item[0] == 'pts':
-                for point in item[1:]:
-                    object.points.append(Position().from_sexpr(point))
-            if item[0] == 'stroke': object.stroke = Stroke().from_sexpr(item)
-            if item[0] == 'uuid': object.uuid = item[1]
+            token = item[0]
+            if token == 'pts':
+                object.points.extend([Position.from_sexpr(point) for point in item[1:]])
+            elif token == 'stroke': object.stroke = Stroke.from_sexpr(item)
+            elif token == 'uuid': object.uuid = item[1]
         return object
 
-    def to_sexpr(self, indent=2, newline=True) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
 
         Args:
+            - buf (StringIO): Buffer the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
-        points = ''
-        for point in self.points:
-            points += f' (xy {point.X} {point.Y})'
+        points = ''.join([f' (xy {point.X} {point.Y})' for point in self.points])
 
-        expression =  f'{indents}(polyline (pts{points})\n'
-        expression += self.stroke.to_sexpr(indent+2)
+        buf.write(f'{indents}(polyline (pts{points})\n')
+        buf.write(self.stroke.to_sexpr(indent+2))
         if self.uuid is not None:
-            expression += f'{indents}  (uuid {self.uuid})\n'
-        expression += f'{indents}){endline}'
-        return expression
+            buf.write(f'{indents}  (uuid {self.uuid})\n')
+        buf.write(f'{indents}){endline}')
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
 
+@add_slots
 @dataclass
 class Text():
     """The ``text`` token defines graphical text in a schematic
@@ -435,10 +474,10 @@ class Text():
     text: str = ""
     """The ``text`` token defines the text string"""
 
-    position: Position = field(default_factory=lambda: Position())
+    position: Position = field(default_factory=Position)
     """The ``position`` token defines the X and Y coordinates and rotation angle of the text"""
 
-    effects: Effects = field(default_factory=lambda: Effects())
+    effects: Effects = field(default_factory=Effects)
     """The ``effects`` token defines how the text is drawn"""
 
     uuid: Optional[str] = None
@@ -467,9 +506,10 @@ class Text():
         object = cls()
         object.text = exp[1]
         for item in exp[2:]:
-            if item[0] == 'at': object.position = Position().from_sexpr(item)
-            if item[0] == 'effects': object.effects = Effects().from_sexpr(item)
-            if item[0] == 'uuid': object.uuid = item[1]
+            token = item[0]
+            if token == 'at': object.position = Position.from_sexpr(item)
+            elif token == 'effects': object.effects = Effects.from_sexpr(item)
+            elif token == 'uuid': object.uuid = item[1]
         return object
 
     def to_sexpr(self, indent=2, newline=True) -> str:
@@ -482,7 +522,7 @@ class Text():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         posA = f' {self.position.angle}' if self.position.angle is not None else ''
@@ -501,6 +541,7 @@ class Text():
         expression += f'{indents}){endline}'
         return expression
 
+@add_slots
 @dataclass
 class TextBox():
     """The ``text_box`` token defines a text box inside a schematic
@@ -513,19 +554,19 @@ class TextBox():
     text: str = ""
     """The ``text`` token defines the text string"""
 
-    position: Position = field(default_factory=lambda: Position())
+    position: Position = field(default_factory=Position)
     """The ``position`` token defines the X and Y coordinates and rotation angle of the text"""
 
-    size: Position = field(default_factory=lambda: Position())
+    size: Position = field(default_factory=Position)
     """The ``size`` token defines the size in X and Y direction. Angle is not used."""
 
-    stroke: Stroke = field(default_factory=lambda: Stroke())
+    stroke: Stroke = field(default_factory=Stroke)
     """The ``stroke`` token defines the look of the outline of the text box"""
 
-    fill: Fill = field(default_factory=lambda: Fill())
+    fill: Fill = field(default_factory=Fill)
     """The ``fill`` token defines how the text box should be filled"""
 
-    effects: Effects = field(default_factory=lambda: Effects())
+    effects: Effects = field(default_factory=Effects)
     """The ``effects`` token defines how the text is drawn"""
 
     uuid: Optional[str] = None
@@ -554,12 +595,13 @@ class TextBox():
         object = cls()
         object.text = exp[1]
         for item in exp[2:]:
-            if item[0] == 'at': object.position = Position().from_sexpr(item)
-            if item[0] == 'size': object.size = Position().from_sexpr(item)
-            if item[0] == 'effects': object.effects = Effects().from_sexpr(item)
-            if item[0] == 'stroke': object.stroke = Stroke().from_sexpr(item)
-            if item[0] == 'fill': object.fill = Fill().from_sexpr(item)
-            if item[0] == 'uuid': object.uuid = item[1]
+            token = item[0]
+            if token == 'at': object.position = Position.from_sexpr(item)
+            elif token == 'size': object.size = Position.from_sexpr(item)
+            elif token == 'effects': object.effects = Effects.from_sexpr(item)
+            elif token == 'stroke': object.stroke = Stroke.from_sexpr(item)
+            elif token == 'fill': object.fill = Fill.from_sexpr(item)
+            elif token == 'uuid': object.uuid = item[1]
         return object
 
     def to_sexpr(self, indent=2, newline=True) -> str:
@@ -572,7 +614,7 @@ class TextBox():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         posA = f' {self.position.angle}' if self.position.angle is not None else ''
@@ -587,6 +629,7 @@ class TextBox():
         expression += f'{indents}){endline}'
         return expression
 
+@add_slots
 @dataclass
 class LocalLabel():
     """The ``label`` token defines an wire or bus label name in a schematic
@@ -598,10 +641,10 @@ class LocalLabel():
     text: str = ""
     """The ``text`` token defines the text in the label"""
 
-    position: Position = field(default_factory=lambda: Position())
+    position: Position = field(default_factory=Position)
     """The ``position`` token defines the X and Y coordinates and rotation angle of the label"""
 
-    effects: Effects = field(default_factory=lambda: Effects())
+    effects: Effects = field(default_factory=Effects)
     """The ``effects`` token defines how the label is drawn"""
 
     uuid: Optional[str] = None
@@ -634,10 +677,11 @@ class LocalLabel():
         object = cls()
         object.text = exp[1]
         for item in exp[2:]:
-            if item[0] == 'at': object.position = Position().from_sexpr(item)
-            if item[0] == 'effects': object.effects = Effects().from_sexpr(item)
-            if item[0] == 'uuid': object.uuid = item[1]
-            if item[0] == 'fields_autoplaced': object.fieldsAutoplaced = True
+            token = item[0]
+            if token == 'at': object.position = Position.from_sexpr(item)
+            elif token == 'effects': object.effects = Effects.from_sexpr(item)
+            elif token == 'uuid': object.uuid = item[1]
+            elif token == 'fields_autoplaced': object.fieldsAutoplaced = True
         return object
 
     def to_sexpr(self, indent=2, newline=True) -> str:
@@ -650,7 +694,7 @@ class LocalLabel():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         posA = f' {self.position.angle}' if self.position.angle is not None else ''
@@ -663,6 +707,7 @@ class LocalLabel():
         expression += f'{indents}){endline}'
         return expression
 
+@add_slots
 @dataclass
 class GlobalLabel():
     """The ``global_label`` token defines a label name that is visible across all schematics in a design
@@ -682,10 +727,10 @@ class GlobalLabel():
     """The ``fields_autoplaced`` is a flag that indicates that any PROPERTIES associated
        with the global label have been place automatically"""
 
-    position: Position = field(default_factory=lambda: Position())
+    position: Position = field(default_factory=Position)
     """The ``position`` token defines the X and Y coordinates and rotation angle of the label"""
 
-    effects: Effects = field(default_factory=lambda: Effects())
+    effects: Effects = field(default_factory=Effects)
     """The ``effects`` token defines how the label is drawn"""
 
     uuid: Optional[str] = None
@@ -718,12 +763,13 @@ class GlobalLabel():
         object = cls()
         object.text = exp[1]
         for item in exp[2:]:
-            if item[0] == 'fields_autoplaced': object.fieldsAutoplaced = True
-            if item[0] == 'at': object.position = Position().from_sexpr(item)
-            if item[0] == 'effects': object.effects = Effects().from_sexpr(item)
-            if item[0] == 'property': object.properties.append(Property().from_sexpr(item))
-            if item[0] == 'shape': object.shape = item[1]
-            if item[0] == 'uuid': object.uuid = item[1]
+            token = item[0]
+            if token == 'fields_autoplaced': object.fieldsAutoplaced = True
+            elif token == 'at': object.position = Position.from_sexpr(item)
+            elif token == 'effects': object.effects = Effects.from_sexpr(item)
+            elif token == 'property': object.properties.append(Property.from_sexpr(item))
+            elif token == 'shape': object.shape = item[1]
+            elif token == 'uuid': object.uuid = item[1]
         return object
 
     def to_sexpr(self, indent=2, newline=True) -> str:
@@ -736,7 +782,7 @@ class GlobalLabel():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         posA = f' {self.position.angle}' if self.position.angle is not None else ''
@@ -751,6 +797,7 @@ class GlobalLabel():
         expression += f'{indents}){endline}'
         return expression
 
+@add_slots
 @dataclass
 class HierarchicalLabel():
     """The ``hierarchical_label`` token defines a label that are used by hierarchical sheets to
@@ -767,10 +814,10 @@ class HierarchicalLabel():
     """The ``shape`` token defines the way the global label is drawn. Possible values are:
     ``input``, ``output``, ``bidirectional``, ``tri_state``, ``passive``."""
 
-    position: Position = field(default_factory=lambda: Position())
+    position: Position = field(default_factory=Position)
     """The ``position`` token defines the X and Y coordinates and rotation angle of the label"""
 
-    effects: Effects = field(default_factory=lambda: Effects())
+    effects: Effects = field(default_factory=Effects)
     """The ``effects`` token defines how the label is drawn"""
 
     uuid: Optional[str] = None
@@ -803,11 +850,12 @@ class HierarchicalLabel():
         object = cls()
         object.text = exp[1]
         for item in exp[2:]:
-            if item[0] == 'at': object.position = Position().from_sexpr(item)
-            if item[0] == 'effects': object.effects = Effects().from_sexpr(item)
-            if item[0] == 'shape': object.shape = item[1]
-            if item[0] == 'uuid': object.uuid = item[1]
-            if item[0] == 'fields_autoplaced': object.fieldsAutoplaced = True
+            token = item[0]
+            if token == 'at': object.position = Position.from_sexpr(item)
+            elif token == 'effects': object.effects = Effects.from_sexpr(item)
+            elif token == 'shape': object.shape = item[1]
+            elif token == 'uuid': object.uuid = item[1]
+            elif token == 'fields_autoplaced': object.fieldsAutoplaced = True
         return object
 
     def to_sexpr(self, indent=2, newline=True) -> str:
@@ -820,7 +868,7 @@ class HierarchicalLabel():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         posA = f' {self.position.angle}' if self.position.angle is not None else ''
@@ -833,6 +881,7 @@ class HierarchicalLabel():
         expression += f'{indents}){endline}'
         return expression
 
+@add_slots
 @dataclass
 class SymbolProjectPath():
     """The symbol project path defines the ``path`` token to the sheet instance of the instance data
@@ -878,8 +927,9 @@ class SymbolProjectPath():
         object = cls()
         object.sheetInstancePath = exp[1]
         for item in exp[2:]:
-            if item[0] == 'reference': object.reference = item[1]
-            if item[0] == 'unit': object.unit = item[1]
+            token = item[0]
+            if token == 'reference': object.reference = item[1]
+            elif token == 'unit': object.unit = item[1]
         return object
 
     def to_sexpr(self, indent=4, newline=True) -> str:
@@ -892,13 +942,14 @@ class SymbolProjectPath():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
         expression =  f'{indents}(path "{dequote(self.sheetInstancePath)}"\n'
         expression += f'{indents}  (reference "{dequote(self.reference)}") (unit {self.unit})\n'
         expression += f'{indents}){endline}'
         return expression
 
+@add_slots
 @dataclass
 class SymbolProjectInstance(ProjectInstance):
     """The ``project`` token attribute defines the name of the project as well as a list of symbol
@@ -941,7 +992,22 @@ class SymbolProjectInstance(ProjectInstance):
             if item[0] == 'path': object.paths.append(SymbolProjectPath.from_sexpr(item))
         return object
 
-    def to_sexpr(self, indent=2, newline=True) -> str:
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
+
+        Args:
+            - buf (StringIO): Buffer the S-Expression is written to
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+        """
+        indents = INDENTS[indent]
+        endline = '\n' if newline else ''
+        buf.write(f'{indents}(project "{dequote(self.name)}"\n')
+        for path in self.paths:
+            buf.write(path.to_sexpr(indent+2))
+        buf.write(f'{indents}){endline}')
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
 
         Args:
@@ -951,14 +1017,11 @@ class SymbolProjectInstance(ProjectInstance):
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
-        endline = '\n' if newline else ''
-        expression = f'{indents}(project "{dequote(self.name)}"\n'
-        for path in self.paths:
-            expression += path.to_sexpr(indent+2)
-        expression += f'{indents}){endline}'
-        return expression
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
 
+@add_slots
 @dataclass
 class SchematicSymbol():
     """The ``symbol`` token in the symbol section of the schematic defines an instance of a symbol
@@ -993,7 +1056,7 @@ class SchematicSymbol():
             - symbol_id (str): The symbol id in the following format: ``<libraryNickname>:<entryName>``
               or only ``<entryName>``
         """
-        parse_symbol_id = re.match(r"^(.+?):(.+?)$", symbol_id)
+        parse_symbol_id = _LIB_ID_RE.match(symbol_id)
         if parse_symbol_id:
             self.libraryNickname = parse_symbol_id.group(1)
             self.entryName = parse_symbol_id.group(2)
@@ -1014,7 +1077,7 @@ class SchematicSymbol():
     It may be set to ``<entryName>_X`` where X is a unique number that specifies which variation
     this symbol is of its original."""
 
-    position: Position = field(default_factory=lambda: Position())
+    position: Position = field(default_factory=Position)
     """The ``position`` defines the X and Y coordinates and angle of rotation of the symbol"""
 
     unit: Optional[int] = None
@@ -1081,38 +1144,38 @@ class SchematicSymbol():
 
         object = cls()
         for item in exp[1:]:
-            if item[0] == 'fields_autoplaced': object.fieldsAutoplaced = True
-            if item[0] == 'lib_id': object.libId = item[1]
-            if item[0] == 'lib_name': object.libName = item[1]
-            if item[0] == 'uuid': object.uuid = item[1]
-            if item[0] == 'unit': object.unit = item[1]
-            if item[0] == 'in_bom': object.inBom = True if item[1] == 'yes' else False
-            if item[0] == 'on_board': object.onBoard = True if item[1] == 'yes' else False
-            if item[0] == 'dnp': object.dnp = True if item[1] == 'yes' else False
-            if item[0] == 'at': object.position = Position().from_sexpr(item)
-            if item[0] == 'property': object.properties.append(Property().from_sexpr(item))
-            if item[0] == 'pin': object.pins.update({item[1]: item[2][1]})
-            if item[0] == 'mirror': object.mirror = item[1]
-            if item[0] == 'instances':
+            token = item[0]
+            if token == 'property': object.properties.append(Property.from_sexpr(item))
+            elif token == 'pin': object.pins.update({item[1]: item[2][1]})
+            elif token == 'lib_id': object.libId = item[1]
+            elif token == 'lib_name': object.libName = item[1]
+            elif token == 'at': object.position = Position.from_sexpr(item)
+            elif token == 'mirror': object.mirror = item[1]
+            elif token == 'unit': object.unit = item[1]
+            elif token == 'in_bom': object.inBom = item[1] == 'yes'
+            elif token == 'on_board': object.onBoard = item[1] == 'yes'
+            elif token == 'dnp': object.dnp = item[1] == 'yes'
+            elif token == 'fields_autoplaced': object.fieldsAutoplaced = True
+            elif token == 'uuid': object.uuid = item[1]
+            elif token == 'instances':
                 for instance in item[1:]:
                     object.instances.append(SymbolProjectInstance.from_sexpr(instance))
         
         return object
 
-    def to_sexpr(self, indent=2, newline=True) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
 
         Args:
+            - buf (StringIO): Buffer the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
-        posA = f' {self.position.angle}' if self.position.angle is not None else ''
+        position = self.position
+        posA = f' {position.angle}' if position.angle is not None else ''
         fa = f' (fields_autoplaced)' if self.fieldsAutoplaced else ''
         inBom = 'yes' if self.inBom else 'no'
         onBoard = 'yes' if self.onBoard else 'no'
@@ -1124,22 +1187,36 @@ class SchematicSymbol():
         else:
             dnp = ''
 
-        expression =  f'{indents}(symbol{lib_name} (lib_id "{dequote(self.libId)}") (at {self.position.X} {self.position.Y}{posA}){mirror}{unit}\n'
-        expression += f'{indents}  (in_bom {inBom}) (on_board {onBoard}){dnp}{fa}\n'
+        buf.write(f'{indents}(symbol{lib_name} (lib_id "{dequote(self.libId)}") (at {position.X} {position.Y}{posA}){mirror}{unit}\n')
+        buf.write(f'{indents}  (in_bom {inBom}) (on_board {onBoard}){dnp}{fa}\n')
         if self.uuid:
-            expression += f'{indents}  (uuid {self.uuid})\n'
+            buf.write(f'{indents}  (uuid {self.uuid})\n')
         for property in self.properties:
-            expression += property.to_sexpr(indent+2)
+            buf.write(property.to_sexpr(indent+2))
         for number, uuid in self.pins.items():
-            expression += f'{indents}  (pin "{dequote(number)}" (uuid {uuid}))\n'
+            buf.write(f'{indents}  (pin "{dequote(number)}" (uuid {uuid}))\n')
         if len(self.instances) != 0:
-            expression += f'{indents}  (instances\n'
+            buf.write(f'{indents}  (instances\n')
             for instance in self.instances:
-                expression += instance.to_sexpr(indent+4)
-            expression += f'{indents}  )\n'
-        expression += f'{indents}){endline}'
-        return expression
+                instance.write_to(buf, indent+4)
+            buf.write(f'{indents}  )\n')
+        buf.write(f'{indents}){endline}')
 
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
+
+@add_slots
 @dataclass
 class HierarchicalPin():
     """The ``pin`` token in a sheet object defines an electrical connection between the sheet in a
@@ -1157,10 +1234,10 @@ class HierarchicalPin():
     """The electrical connect type token defines the type of electrical connect made by the
        sheet pin"""
 
-    position: Position = field(default_factory=lambda: Position())
+    position: Position = field(default_factory=Position)
     """The ``position`` defines the X and Y coordinates and angle of rotation of the pin"""
 
-    effects: Effects = field(default_factory=lambda: Effects())
+    effects: Effects = field(default_factory=Effects)
     """The ``effects`` section defines how the pin name text is drawn"""
 
     uuid: Optional[str] = None
@@ -1190,9 +1267,10 @@ class HierarchicalPin():
         object.name = exp[1]
         object.connectionType = exp[2]
         for item in exp[3:]:
-            if item[0] == 'at': object.position = Position().from_sexpr(item)
-            if item[0] == 'effects': object.effects = Effects().from_sexpr(item)
-            if item[0] == 'uuid': object.uuid = item[1]
+            token = item[0]
+            if token == 'at': object.position = Position.from_sexpr(item)
+            elif token == 'effects': object.effects = Effects.from_sexpr(item)
+            elif token == 'uuid': object.uuid = item[1]
         return object
 
     def to_sexpr(self, indent=4, newline=True) -> str:
@@ -1205,7 +1283,7 @@ class HierarchicalPin():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         posA = f' {self.position.angle}' if self.position.angle is not None else ''
@@ -1218,6 +1296,7 @@ class HierarchicalPin():
         return expression
 
 
+@add_slots
 @dataclass
 class HierarchicalSheetProjectPath():
     """The symbol project path defines the ``path`` token to the sheet instance of the instance data
@@ -1271,10 +1350,11 @@ class HierarchicalSheetProjectPath():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
         return f'{indents}(path "{dequote(self.sheetInstancePath)}" (page "{dequote(self.page)}")){endline}'
 
+@add_slots
 @dataclass
 class HierarchicalSheetProjectInstance(ProjectInstance):
     """The ``project`` token attribute defines the name of the project as well as a list of 
@@ -1317,7 +1397,22 @@ class HierarchicalSheetProjectInstance(ProjectInstance):
             if item[0] == 'path': object.paths.append(HierarchicalSheetProjectPath.from_sexpr(item))
         return object
 
-    def to_sexpr(self, indent=2, newline=True) -> str:
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
+
+        Args:
+            - buf (StringIO): Buffer the S-Expression is written to
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+        """
+        indents = INDENTS[indent]
+        endline = '\n' if newline else ''
+        buf.write(f'{indents}(project "{dequote(self.name)}"\n')
+        for path in self.paths:
+            buf.write(path.to_sexpr(indent+2))
+        buf.write(f'{indents}){endline}')
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
         """Generate the S-Expression representing this object
 
         Args:
@@ -1327,14 +1422,11 @@ class HierarchicalSheetProjectInstance(ProjectInstance):
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
-        endline = '\n' if newline else ''
-        expression = f'{indents}(project "{dequote(self.name)}"\n'
-        for path in self.paths:
-            expression += path.to_sexpr(indent+2)
-        expression += f'{indents}){endline}'
-        return expression
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
 
+@add_slots
 @dataclass
 class HierarchicalSheet():
     """The ``sheet`` token defines a hierarchical sheet of the schematic
@@ -1343,7 +1435,7 @@ class HierarchicalSheet():
         https://dev-docs.kicad.org/en/file-formats/sexpr-schematic/#_hierarchical_sheet_section
     """
 
-    position: Position = field(default_factory=lambda: Position())
+    position: Position = field(default_factory=Position)
     """The ``position`` defines the X and Y coordinates and angle of rotation of the sheet in the schematic"""
 
     width: float = 0
@@ -1356,10 +1448,10 @@ class HierarchicalSheet():
     """The ``fields_autoplaced`` is a flag that indicates that any PROPERTIES associated
        with the global label have been place automatically"""
 
-    stroke: Stroke = field(default_factory=lambda: Stroke())
+    stroke: Stroke = field(default_factory=Stroke)
     """The ``stroke`` defines how the sheet outline is drawn"""
 
-    fill: ColorRGBA = field(default_factory=lambda: ColorRGBA())
+    fill: ColorRGBA = field(default_factory=ColorRGBA)
     """The fill defines the color how the sheet is filled"""
 
     uuid: Optional[str] = None
@@ -1409,61 +1501,74 @@ class HierarchicalSheet():
 
         object = cls()
         for item in exp[1:]:
-            if item[0] == 'fields_autoplaced': object.fieldsAutoplaced = True
-            if item[0] == 'at': object.position = Position().from_sexpr(item)
-            if item[0] == 'stroke': object.stroke = Stroke().from_sexpr(item)
-            if item[0] == 'size':
+            token = item[0]
+            if token == 'pin': object.pins.append(HierarchicalPin.from_sexpr(item))
+            elif token == 'property':
+                p = Property.from_sexpr(item)
+                if item[1] in _SHEET_NAME_KEYS: object.sheetName = p
+                elif item[1] in _SHEET_FILE_KEYS: object.fileName = p
+                else: object.properties.append(p)
+            elif token == 'at': object.position = Position.from_sexpr(item)
+            elif token == 'size':
                 object.width = item[1]
                 object.height = item[2]
-            if item[0] == 'fill':
-                object.fill = ColorRGBA().from_sexpr(item[1])
+            elif token == 'fields_autoplaced': object.fieldsAutoplaced = True
+            elif token == 'stroke': object.stroke = Stroke.from_sexpr(item)
+            elif token == 'fill':
+                object.fill = ColorRGBA.from_sexpr(item[1])
                 object.fill.precision = 4
-            if item[0] == 'uuid': object.uuid = item[1]
-            if item[0] == 'property':
-                p = Property().from_sexpr(item)
-                if item[1] == 'Sheet name' or item[1] == 'Sheetname': object.sheetName = p
-                elif item[1] == 'Sheet file' or item[1] == 'Sheetfile': object.fileName = p
-                else: object.properties.append(p)
-            if item[0] == 'pin': object.pins.append(HierarchicalPin().from_sexpr(item))
-            if item[0] == 'instances':
+            elif token == 'uuid': object.uuid = item[1]
+            elif token == 'instances':
                 for instance in item[1:]:
                     object.instances.append(HierarchicalSheetProjectInstance.from_sexpr(instance))
         return object
 
-    def to_sexpr(self, indent=2, newline=True) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf: StringIO, indent: int = 2, newline: bool = True) -> None:
+        """Write the S-Expression representing this object into the given buffer
 
         Args:
+            - buf (StringIO): Buffer the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         fa = ' (fields_autoplaced)' if self.fieldsAutoplaced else ''
 
-        expression =  f'{indents}(sheet (at {self.position.X} {self.position.Y}) (size {self.width} {self.height}){fa}\n'
-        expression += self.stroke.to_sexpr(indent+2)
-        expression += f'{indents}  (fill {self.fill.to_sexpr()})\n'
+        buf.write(f'{indents}(sheet (at {self.position.X} {self.position.Y}) (size {self.width} {self.height}){fa}\n')
+        buf.write(self.stroke.to_sexpr(indent+2))
+        buf.write(f'{indents}  (fill {self.fill.to_sexpr()})\n')
         if self.uuid is not None:
-            expression += f'{indents}  (uuid {self.uuid})\n'
-        expression += self.sheetName.to_sexpr(indent+2)
-        expression += self.fileName.to_sexpr(indent+2)
+            buf.write(f'{indents}  (uuid {self.uuid})\n')
+        buf.write(self.sheetName.to_sexpr(indent+2))
+        buf.write(self.fileName.to_sexpr(indent+2))
         for p in self.properties:
-            expression += p.to_sexpr(indent+2)
+            buf.write(p.to_sexpr(indent+2))
         for pin in self.pins:
-            expression += pin.to_sexpr(indent+2)
+            buf.write(pin.to_sexpr(indent+2))
         if len(self.instances) != 0:
-            expression += f'{indents}  (instances\n'
+            buf.write(f'{indents}  (instances\n')
             for instance in self.instances:
-                expression += instance.to_sexpr(indent+4)
-            expression += f'{indents}  )\n'
-        expression += f'{indents}){endline}'
-        return expression
+                instance.write_to(buf, indent+4)
+            buf.write(f'{indents}  )\n')
+        buf.write(f'{indents}){endline}')
+
+    def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 2.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
+
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
 
+@add_slots
 @dataclass
 class HierarchicalSheetInstance():
     """The sheet_instance token defines the per sheet information for the entire schematic. This
@@ -1516,11 +1621,12 @@ class HierarchicalSheetInstance():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         return f'{indents}(path "{dequote(self.instancePath)}" (page "{dequote(self.page)}")){endline}'
 
+@add_slots
 @dataclass
 class SymbolInstance():
     """The ``symbol_instance`` token defines the per symbol information for the entire schematic
@@ -1569,10 +1675,11 @@ class SymbolInstance():
         object = cls()
         object.path = exp[1]
         for item in exp[2:]:
-            if item[0] == 'reference': object.reference = item[1]
-            if item[0] == 'unit': object.unit = item[1]
-            if item[0] == 'value': object.value = item[1]
-            if item[0] == 'footprint': object.footprint = item[1]
+            token = item[0]
+            if token == 'reference': object.reference = item[1]
+            elif token == 'unit': object.unit = item[1]
+            elif token == 'value': object.value = item[1]
+            elif token == 'footprint': object.footprint = item[1]
         return object
 
     def to_sexpr(self, indent=4, newline=True) -> str:
@@ -1585,7 +1692,7 @@ class SymbolInstance():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         expression =  f'{indents}(path "{dequote(self.path)}"\n'
@@ -1603,16 +1710,16 @@ class Rectangle():
         https://dev-docs.kicad.org/en/file-formats/sexpr-intro/index.html#_symbol_rectangle
     """
 
-    start: Position = field(default_factory=lambda: Position())
+    start: Position = field(default_factory=Position)
     """The ``start`` token attributes define the coordinates of the start point of the rectangle"""
 
-    end: Position = field(default_factory=lambda: Position())
+    end: Position = field(default_factory=Position)
     """The ``end`` token attributes define the coordinates of the end point of the rectangle"""
 
-    stroke: Stroke = field(default_factory=lambda: Stroke())
+    stroke: Stroke = field(default_factory=Stroke)
     """The ``stroke`` defines how the rectangle outline is drawn"""
 
-    fill: Fill = field(default_factory=lambda: Fill())
+    fill: Fill = field(default_factory=Fill)
     """The ``fill`` token attributes define how rectangle arc is filled"""
 
     uuid: Optional[str] = None
@@ -1641,11 +1748,12 @@ class Rectangle():
         object = cls()
 
         for item in exp:
-            if item[0] == 'start': object.start = Position().from_sexpr(item)
-            if item[0] == 'end': object.end = Position().from_sexpr(item)
-            if item[0] == 'stroke': object.stroke = Stroke().from_sexpr(item)
-            if item[0] == 'fill': object.fill = Fill().from_sexpr(item)
-            if item[0] == 'uuid': object.uuid = item[1]
+            token = item[0]
+            if token == 'start': object.start = Position.from_sexpr(item)
+            elif token == 'end': object.end = Position.from_sexpr(item)
+            elif token == 'stroke': object.stroke = Stroke.from_sexpr(item)
+            elif token == 'fill': object.fill = Fill.from_sexpr(item)
+            elif token == 'uuid': object.uuid = item[1]
         return object
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
@@ -1658,7 +1766,7 @@ class Rectangle():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         expression =  f'{indents}(rectangle (start {self.start.X} {self.start.Y}) (end {self.end.X} {self.end.Y})\n'
@@ -1679,19 +1787,19 @@ class Arc():
         - ???
     """
 
-    start: Position = field(default_factory=lambda: Position())
+    start: Position = field(default_factory=Position)
     """The ``start`` token attributes define the coordinates of the start point of the arc"""
 
-    mid: Position = field(default_factory=lambda: Position())
+    mid: Position = field(default_factory=Position)
     """The ``end`` token attributes define the coordinates of the mid point of the arc"""
 
-    end: Position = field(default_factory=lambda: Position())
+    end: Position = field(default_factory=Position)
     """The ``end`` token attributes define the coordinates of the end point of the arc"""
 
-    stroke: Stroke = field(default_factory=lambda: Stroke())
+    stroke: Stroke = field(default_factory=Stroke)
     """The ``stroke`` defines how the arc outline is drawn"""
 
-    fill: Fill = field(default_factory=lambda: Fill())
+    fill: Fill = field(default_factory=Fill)
     """The ``fill`` token attributes define how the arc is filled"""
 
     uuid: Optional[str] = None
@@ -1720,12 +1828,13 @@ class Arc():
         object = cls()
 
         for item in exp:
-            if item[0] == 'start': object.start = Position().from_sexpr(item)
-            if item[0] == 'mid': object.mid = Position().from_sexpr(item)
-            if item[0] == 'end': object.end = Position().from_sexpr(item)
-            if item[0] == 'stroke': object.stroke = Stroke().from_sexpr(item)
-            if item[0] == 'fill': object.fill = Fill().from_sexpr(item)
-            if item[0] == 'uuid': object.uuid = item[1]
+            token = item[0]
+            if token == 'start': object.start = Position.from_sexpr(item)
+            elif token == 'mid': object.mid = Position.from_sexpr(item)
+            elif token == 'end': object.end = Position.from_sexpr(item)
+            elif token == 'stroke': object.stroke = Stroke.from_sexpr(item)
+            elif token == 'fill': object.fill = Fill.from_sexpr(item)
+            elif token == 'uuid': object.uuid = item[1]
         return object
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
@@ -1738,7 +1847,7 @@ class Arc():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         expression =  f'{indents}(arc (start {self.start.X} {self.start.Y}) (mid {self.mid.X} {self.mid.Y}) (end {self.end.X} {self.end.Y})\n'
@@ -1759,16 +1868,16 @@ class Circle():
         - ???
     """
 
-    center: Position = field(default_factory=lambda: Position())
+    center: Position = field(default_factory=Position)
     """The ``center`` token attributes define the coordinates of the center point of the circle"""
 
     radius: float = 0.0
     """The ``radius`` token attributes define the radius of the circle"""
 
-    stroke: Stroke = field(default_factory=lambda: Stroke())
+    stroke: Stroke = field(default_factory=Stroke)
     """The ``stroke`` defines how the circle outline is drawn"""
 
-    fill: Fill = field(default_factory=lambda: Fill())
+    fill: Fill = field(default_factory=Fill)
     """The ``fill`` token attributes define how the circle is filled"""
 
     uuid: Optional[str] = None
@@ -1797,11 +1906,12 @@ class Circle():
         object = cls()
 
         for item in exp:
-            if item[0] == 'center': object.center = Position().from_sexpr(item)
-            if item[0] == 'radius': object.radius = item[1]
-            if item[0] == 'stroke': object.stroke = Stroke().from_sexpr(item)
-            if item[0] == 'fill': object.fill = Fill().from_sexpr(item)
-            if item[0] == 'uuid': object.uuid = item[1]
+            token = item[0]
+            if token == 'center': object.center = Position.from_sexpr(item)
+            elif token == 'radius': object.radius = item[1]
+            elif token == 'stroke': object.stroke = Stroke.from_sexpr(item)
+            elif token == 'fill': object.fill = Fill.from_sexpr(item)
+            elif token == 'uuid': object.uuid = item[1]
         return object
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
@@ -1814,7 +1924,7 @@ class Circle():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         expression =  f'{indents}(circle (center {self.center.X} {self.center.Y}) (radius {self.radius})\n'
@@ -1845,10 +1955,10 @@ class NetclassFlag():
     """The ``shape`` token defines the shape of the netclass flag. Valid values are ``round``,
     ``rectangle``, ``dot`` or``diamond``."""
 
-    position: Position = field(default_factory=lambda: Position)
+    position: Position = field(default_factory=Position)
     """The ``position`` token defines the position and rotation of the netclass flag"""
 
-    effects: Effects = field(default_factory=lambda: Effects)
+    effects: Effects = field(default_factory=Effects)
     """The ``effects`` token defines how the text is drawn"""
 
     properties: List[Property] = field(default_factory=list)
@@ -1884,13 +1994,14 @@ class NetclassFlag():
         object = cls()
         object.text = exp[1]
         for item in exp[2:]:
-            if item[0] == 'length': object.length = item[1]
-            if item[0] == 'shape': object.shape = item[1]
-            if item[0] == 'at': object.position = Position.from_sexpr(item)
-            if item[0] == 'fields_autoplaced': object.fieldsAutoplaced = True
-            if item[0] == 'effects': object.effects = Effects.from_sexpr(item)
-            if item[0] == 'uuid': object.uuid = item[1]
-            if item[0] == 'property': object.properties.append(Property.from_sexpr(item))
+            token = item[0]
+            if token == 'length': object.length = item[1]
+            elif token == 'shape': object.shape = item[1]
+            elif token == 'at': object.position = Position.from_sexpr(item)
+            elif token == 'fields_autoplaced': object.fieldsAutoplaced = True
+            elif token == 'effects': object.effects = Effects.from_sexpr(item)
+            elif token == 'uuid': object.uuid = item[1]
+            elif token == 'property': object.properties.append(Property.from_sexpr(item))
         return object
 
     def to_sexpr(self, indent: int = 2, newline: bool = True) -> str:
@@ -1903,7 +2014,7 @@ class NetclassFlag():
         Returns:
             - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
         posA = f' {self.position.angle}' if self.position.angle is not None else ''
@@ -73,7 +73,7 @@ class KeepoutSettings():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 continue
 
             if item[0] == 'tracks': object.tracks = item[1]
@@ -200,7 +200,7 @@ class FillSettings():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'yes': object.yes = True
                 else: continue
 
@@ -280,7 +280,7 @@ class ZonePolygon():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 continue
             if item[0] == 'pts':
                 for position in item[1:]:
@@ -353,7 +353,7 @@ class FilledPolygon():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 continue
 
             if item[0] == 'layer': object.layer = item[1]
@@ -430,7 +430,7 @@ class FillSegments():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 continue
 
             if item[0] == 'layer': object.layer = item[1]
@@ -572,7 +572,7 @@ class Zone():
 
         object = cls()
         for item in exp:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'locked': object.locked = True
                 else: continue
 
@@ -16,6 +16,7 @@ Documentation taken from:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from io import StringIO
 from typing import Optional, List, Union
 from os import path
 
@@ -23,6 +24,7 @@ from kiutils.items.common import Image, PageSettings, TitleBlock
 from kiutils.items.schitems import *
 from kiutils.symbol import Symbol
 from kiutils.utils import sexpr
+from kiutils.utils.strings import INDENTS
 from kiutils.misc.config import KIUTILS_CREATE_NEW_GENERATOR_STR, KIUTILS_CREATE_NEW_VERSION_STR
 
 @dataclass
@@ -139,36 +141,36 @@ class Schematic():
             if item[0] == 'version': object.version = item[1]
             if item[0] == 'generator': object.generator = item[1]
             if item[0] == 'uuid': object.uuid = item[1]
-            if item[0] == 'paper': object.paper = PageSettings().from_sexpr(item)
-            if item[0] == 'title_block': object.titleBlock = TitleBlock().from_sexpr(item)
+            if item[0] == 'paper': object.paper = PageSettings.from_sexpr(item)
+            if item[0] == 'title_block': object.titleBlock = TitleBlock.from_sexpr(item)
             if item[0] == 'lib_symbols':
                 for symbol in item[1:]:
-                    object.libSymbols.append(Symbol().from_sexpr(symbol))
-            if item[0] == 'junction': object.junctions.append(Junction().from_sexpr(item))
-            if item[0] == 'no_connect': object.noConnects.append(NoConnect().from_sexpr(item))
-            if item[0] == 'bus_entry': object.busEntries.append(BusEntry().from_sexpr(item))
-            if item[0] == 'bus_alias': object.busAliases.append(BusAlias().from_sexpr(item))
-            if item[0] == 'wire': object.graphicalItems.append(Connection().from_sexpr(item))
-            if item[0] == 'bus': object.graphicalItems.append(Connection().from_sexpr(item))
-            if item[0] == 'polyline': object.graphicalItems.append(PolyLine().from_sexpr(item))
+                    object.libSymbols.append(Symbol.from_sexpr(symbol))
+            if item[0] == 'junction': object.junctions.append(Junction.from_sexpr(item))
+            if item[0] == 'no_connect': object.noConnects.append(NoConnect.from_sexpr(item))
+            if item[0] == 'bus_entry': object.busEntries.append(BusEntry.from_sexpr(item))
+            if item[0] == 'bus_alias': object.busAliases.append(BusAlias.from_sexpr(item))
+            if item[0] == 'wire': object.graphicalItems.append(Connection.from_sexpr(item))
+            if item[0] == 'bus': object.graphicalItems.append(Connection.from_sexpr(item))
+            if item[0] == 'polyline': object.graphicalItems.append(PolyLine.from_sexpr(item))
             if item[0] == 'arc': object.shapes.append(Arc.from_sexpr(item))
             if item[0] == 'circle': object.shapes.append(Circle.from_sexpr(item))
             if item[0] == 'rectangle': object.shapes.append(Rectangle.from_sexpr(item))
-            if item[0] == 'image': object.images.append(Image().from_sexpr(item))
-            if item[0] == 'text': object.texts.append(Text().from_sexpr(item))
-            if item[0] == 'text_box': object.textBoxes.append(TextBox().from_sexpr(item))
-            if item[0] == 'label': object.labels.append(LocalLabel().from_sexpr(item))
-            if item[0] == 'global_label': object.globalLabels.append(GlobalLabel().from_sexpr(item))
-            if item[0] == 'hierarchical_label': object.hierarchicalLabels.append(HierarchicalLabel().from_sexpr(item))
+            if item[0] == 'image': object.images.append(Image.from_sexpr(item))
+            if item[0] == 'text': object.texts.append(Text.from_sexpr(item))
+            if item[0] == 'text_box': object.textBoxes.append(TextBox.from_sexpr(item))
+            if item[0] == 'label': object.labels.append(LocalLabel.from_sexpr(item))
+            if item[0] == 'global_label': object.globalLabels.append(GlobalLabel.from_sexpr(item))
+            if item[0] == 'hierarchical_label': object.hierarchicalLabels.append(HierarchicalLabel.from_sexpr(item))
             if item[0] == 'netclass_flag': object.netclassFlags.append(NetclassFlag.from_sexpr(item))
-            if item[0] == 'symbol': object.schematicSymbols.append(SchematicSymbol().from_sexpr(item))
-            if item[0] == 'sheet': object.sheets.append(HierarchicalSheet().from_sexpr(item))
+            if item[0] == 'symbol': object.schematicSymbols.append(SchematicSymbol.from_sexpr(item))
+            if item[0] == 'sheet': object.sheets.append(HierarchicalSheet.from_sexpr(item))
             if item[0] == 'sheet_instances':
                 for instance in item[1:]:
-                    object.sheetInstances.append(HierarchicalSheetInstance().from_sexpr(instance))
+                    object.sheetInstances.append(HierarchicalSheetInstance.from_sexpr(instance))
             if item[0] == 'symbol_instances':
                 for instance in item[1:]:
-                    object.symbolInstances.append(SymbolInstance().from_sexpr(instance))
+                    object.symbolInstances.append(SymbolInstance.from_sexpr(instance))
         return object
 
     @classmethod
@@ -227,125 +229,149 @@ class Schematic():
             filepath = self.filePath
 
         with open(filepath, 'w', encoding=encoding) as outfile:
-            outfile.write(self.to_sexpr())
+            self.write_to(outfile)
 
-    def to_sexpr(self, indent=0, newline=True) -> str:
-        """Generate the S-Expression representing this object
+    def write_to(self, buf, indent=0, newline=True) -> None:
+        """Write the S-Expression representing this object into the given buffer or file
 
         Args:
+            - buf: Text buffer or file object the S-Expression is written to
             - indent (int): Number of whitespaces used to indent the output. Defaults to 0.
             - newline (bool): Adds a newline to the end of the output. Defaults to True.
-
-        Returns:
-            - str: S-Expression of this object
         """
-        indents = ' '*indent
+        indents = INDENTS[indent]
         endline = '\n' if newline else ''
 
-        expression =  f'{indents}(kicad_sch (version {self.version}) (generator {self.generator})\n'
+        buf.write(f'{indents}(kicad_sch (version {self.version}) (generator {self.generator})\n')
         if self.uuid is not None:
-            expression += f'\n{indents}  (uuid {self.uuid})\n\n'
-        expression += f'{self.paper.to_sexpr(indent+2)}'
+            buf.write(f'\n{indents}  (uuid {self.uuid})\n\n')
+        buf.write(self.paper.to_sexpr(indent+2))
         if self.titleBlock is not None:
-            expression += f'\n{self.titleBlock.to_sexpr(indent+2)}'
+            buf.write(f'\n{self.titleBlock.to_sexpr(indent+2)}')
 
         if self.libSymbols:
-            expression += f'\n{indents}  (lib_symbols'
+            buf.write(f'\n{indents}  (lib_symbols')
             for item in self.libSymbols:
-                expression += '\n'
-                expression += item.to_sexpr(indent+4)
-            expression += f'{indents}  )\n'
+                buf.write('\n')
+                buf.write(item.to_sexpr(indent+4))
+            buf.write(f'{indents}  )\n')
         else:
-            expression += f'{indents}  (lib_symbols)\n'
+            buf.write(f'{indents}  (lib_symbols)\n')
 
         if self.junctions:
-            expression += '\n'
+            buf.write('\n')
             for item in self.junctions:
-                expression += item.to_sexpr(indent+2)
+                buf.write(item.to_sexpr(indent+2))
 
         if self.noConnects:
-            expression += '\n'
+            buf.write('\n')
             for item in self.noConnects:
-                expression += item.to_sexpr(indent+2)
+                buf.write(item.to_sexpr(indent+2))
 
         if self.busEntries:
-            expression += '\n'
+            buf.write('\n')
             for item in self.busEntries:
-                expression += item.to_sexpr(indent+2)
+                buf.write(item.to_sexpr(indent+2))
 
         if self.busAliases:
-            expression += '\n'
+            buf.write('\n')
             for item in self.busAliases:
-                expression += item.to_sexpr(indent+2)
+                buf.write(item.to_sexpr(indent+2))
 
         if self.graphicalItems:
-            expression += '\n'
+            buf.write('\n')
             for item in self.graphicalItems:
-                expression += item.to_sexpr(indent+2)
+                # Items without a write_to() method are written via their to_sexpr()
+                write_to = getattr(item, 'write_to', None)
+                if write_to is not None:
+                    write_to(buf, indent+2)
+                else:
+                    buf.write(item.to_sexpr(indent+2))
 
         if self.shapes:
-            expression += '\n'
+            buf.write('\n')
             for item in self.shapes:
-                expression += item.to_sexpr(indent+2)
+                buf.write(item.to_sexpr(indent+2))
 
         if self.images:
-            expression += '\n'
+            buf.write('\n')
             for item in self.images:
-                expression += item.to_sexpr(indent+2)
+                buf.write(item.to_sexpr(indent+2))
 
         if self.textBoxes:
-            expression += '\n'
+            buf.write('\n')
             for item in self.textBoxes:
-                expression += item.to_sexpr(indent+2)
+                buf.write(item.to_sexpr(indent+2))
 
         if self.texts:
-            expression += '\n'
+            buf.write('\n')
             for item in self.texts:
-                expression += item.to_sexpr(indent+2)
+                buf.write(item.to_sexpr(indent+2))
 
         if self.labels:
-            expression += '\n'
+            buf.write('\n')
             for item in self.labels:
-                expression += item.to_sexpr(indent+2)
+                buf.write(item.to_sexpr(indent+2))
 
         if self.globalLabels:
-            expression += '\n'
+            buf.write('\n')
             for item in self.globalLabels:
-                expression += item.to_sexpr(indent+2)
+                buf.write(item.to_sexpr(indent+2))
 
         if self.hierarchicalLabels:
-            expression += '\n'
+            buf.write('\n')
             for item in self.hierarchicalLabels:
-                expression += item.to_sexpr(indent+2)
+                buf.write(item.to_sexpr(indent+2))
 
         if self.netclassFlags:
-            expression += '\n'
+            buf.write('\n')
             for item in self.netclassFlags:
-                expression += item.to_sexpr(indent+2)
+                buf.write(item.to_sexpr(indent+2))
 
         if self.schematicSymbols:
             for item in self.schematicSymbols:
-                expression += '\n'
-                expression += item.to_sexpr(indent+2)
+                buf.write('\n')
+                write_to = getattr(item, 'write_to', None)
+                if write_to is not None:
+                    write_to(buf, indent+2)
+                else:
+                    buf.write(item.to_sexpr(indent+2))
 
         if self.sheets:
             for item in self.sheets:
-                expression += '\n'
-                expression += item.to_sexpr(indent+2)
+                buf.write('\n')
+                write_to = getattr(item, 'write_to', None)
+                if write_to is not None:
+                    write_to(buf, indent+2)
+                else:
+                    buf.write(item.to_sexpr(indent+2))
 
         if self.sheetInstances:
-            expression += '\n'
-            expression += '  (sheet_instances\n'
+            buf.write('\n')
+            buf.write('  (sheet_instances\n')
             for item in self.sheetInstances:
-                expression += item.to_sexpr(indent+4)
-            expression += '  )\n'
+                buf.write(item.to_sexpr(indent+4))
+            buf.write('  )\n')
 
         if self.symbolInstances:
-            expression += '\n'
-            expression += '  (symbol_instances\n'
+            buf.write('\n')
+            buf.write('  (symbol_instances\n')
             for item in self.symbolInstances:
-                expression += item.to_sexpr(indent+4)
-            expression += '  )\n'
+                buf.write(item.to_sexpr(indent+4))
+            buf.write('  )\n')
+
+        buf.write(f'{indents}){endline}')
+
+    def to_sexpr(self, indent=0, newline=True) -> str:
+        """Generate the S-Expression representing this object
+
+        Args:
+            - indent (int): Number of whitespaces used to indent the output. Defaults to 0.
+            - newline (bool): Adds a newline to the end of the output. Defaults to True.
 
-        expression += f'{indents}){endline}'
-        return expression
+        Returns:
+            - str: S-Expression of this object
+        """
+        buf = StringIO()
+        self.write_to(buf, indent, newline)
+        return buf.getvalue()
@@ -146,7 +146,7 @@ class SymbolPin():
         object.electricalType = exp[1]
         object.graphicalStyle = exp[2]
         for item in exp[3:]:
-            if type(item) != type([]):
+            if not isinstance(item, list):
                 if item == 'hide': object.hide = True
                 else: continue
             if item[0] == 'at': object.position = Position().from_sexpr(item)
@@ -385,7 +385,7 @@ class Symbol():
             if item[0] == 'pin_names':
                 object.pinNames = True
                 for property in item[1:]:
-                    if type(property) == type([]):
+                    if isinstance(property, list):
                         if property[0] == 'offset': object.pinNamesOffset = property[1]
                     else:
                         if property == 'hide': object.pinNamesHide = True
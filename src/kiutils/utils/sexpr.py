@@ -3,6 +3,7 @@
 # Originally taken from: https://gitlab.com/kicad/libraries/kicad-library-utils/-/blob/master/common/sexpr.py
 
 import re
+from sys import intern
 
 dbg = False
 
@@ -20,7 +21,9 @@ def parse_sexp(sexp):
     out = []
     if dbg: print("%-6s %-14s %-44s %-s" % tuple("term value out stack".split()))
     for termtypes in re.finditer(term_regex, sexp):
-        term, value = [(t,v) for t,v in termtypes.groupdict().items() if v][0]
+        # Exactly one named group matches per term, so lastgroup names it directly
+        term = termtypes.lastgroup
+        value = termtypes.group(term)
         if dbg: print("%-7s %-14s %-44r %-r" % (term, value, out, stack))
         if   term == 'brackl':
             stack.append(out)
@@ -36,7 +39,9 @@ def parse_sexp(sexp):
         elif term == 'sq':
             out.append(value[1:-1].replace(r'\"', '"'))
         elif term == 's':
-            out.append(value)
+            # The first symbol of a list is its token name. Interning it lets the token comparisons
+            # in the from_sexpr() parsers match on identity instead of comparing characters.
+            out.append(value if out else intern(value))
         else:
             raise NotImplementedError("Error: %r" % (term, value))
     assert not stack, "Trouble with nesting of brackets"
@@ -0,0 +1,53 @@
+"""Functions to add ``__slots__`` to dataclasses
+
+Author:
+    (C) Marvin Mager - @mvnmgrx - 2022
+
+License identifier:
+    GPL-3.0
+"""
+
+from dataclasses import fields
+
+def add_slots(cls):
+    """Class decorator that recreates the given dataclass with ``__slots__`` set to its fields. This
+    removes the per-instance ``__dict__``, which reduces the memory footprint of classes that are
+    instantiated a lot and speeds up attribute access. Equivalent to ``@dataclass(slots=True)``, which
+    is only available for Python versions >= 3.10.
+
+    Must be applied on top of the ``@dataclass`` decorator.
+
+    Args:
+        - cls: The dataclass to add slots to
+
+    Raises:
+        - TypeError: When the given class already defines ``__slots__``
+
+    Returns:
+        - The new class with ``__slots__``
+    """
+    if '__slots__' in cls.__dict__:
+        raise TypeError(f'{cls.__name__} already specifies __slots__')
+
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+
+    # Fields inherited from a slotted base class already have a slot there
+    inherited_slots = set()
+    for base in cls.__mro__[1:-1]:
+        base_slots = base.__dict__.get('__slots__', ())
+        inherited_slots.update((base_slots,) if isinstance(base_slots, str) else base_slots)
+    cls_dict['__slots__'] = tuple(name for name in field_names if name not in inherited_slots)
+
+    # Default values are stored as class attributes, which would conflict with the slot descriptors.
+    # The generated __init__() already holds the defaults.
+    for name in field_names:
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+
+    qualname = getattr(cls, '__qualname__', None)
+    cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    if qualname is not None:
+        cls.__qualname__ = qualname
+    return cls
@@ -10,6 +10,27 @@ Major changes:
     28.02.2022 - created
 """
 
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from kiutils.items.common import Stroke
+
+class _IndentCache(dict):
+    """Dictionary that maps a number of whitespaces to a string of that many whitespaces. Missing
+    entries are created on first access and kept for later lookups."""
+
+    def __missing__(self, indent: int) -> str:
+        indents = ' '*indent
+        self[indent] = indents
+        return indents
+
+INDENTS = _IndentCache()
+"""Cache of indentation strings used when generating S-Expressions. Use ``INDENTS[indent]``
+instead of ``' '*indent`` to avoid creating a new string on each call."""
+
 def dequote(input: str) -> str:
     """Escapes double-quotes in a string using a backslash
 
@@ -21,6 +42,76 @@ def dequote(input: str) -> str:
     """
     return str(input).replace("\"", "\\\"")
 
+@lru_cache(maxsize=256)
+def dequote_layer(layer: str) -> str:
+    """Cached version of ``dequote()`` for layer names. Boards and footprint libraries only use a
+    handful of distinct layers, so escaping them once is sufficient.
+
+    Args:
+        - layer (str): Layer name to escape
+
+    Returns:
+        - str: Layer name with escaped double-quotes
+    """
+    return dequote(layer)
+
+def layer_token(layer: Optional[str]) -> str:
+    """Create the ``(layer ..)`` token of a graphical item
+
+    Args:
+        - layer (str, optional): Canonical layer name of the item
+
+    Returns:
+        - str: The ``(layer ..)`` token with a leading whitespace, or an empty string if no layer is
+               set
+    """
+    return f' (layer "{dequote_layer(layer)}")' if layer is not None else ''
+
+@lru_cache(maxsize=256, typed=True)
+def width_token(width: float) -> str:
+    """Cached ``(width ..)`` token. Graphical items usually share a small set of line widths, so
+    the number only has to be formatted once per distinct width. The cache is typed, so that ``1``
+    and ``1.0`` keep their own representation.
+
+    Args:
+        - width (float): Line width
+
+    Returns:
+        - str: The ``(width ..)`` token with a leading whitespace
+    """
+    return f' (width {width})'
+
+@lru_cache(maxsize=16)
+def fill_token(fill: Optional[str]) -> str:
+    """Cached ``(fill ..)`` token. Only a few fill types exist, so each token is built once.
+
+    Args:
+        - fill (str, optional): Fill type of the item
+
+    Returns:
+        - str: The ``(fill ..)`` token with a leading whitespace, or an empty string if no fill is
+               set
+    """
+    return f' (fill {fill})' if fill is not None else ''
+
+def width_or_stroke_token(width: Optional[float], stroke: Optional[Stroke]) -> str:
+    """Create the line width token of a graphical item. Items prior to KiCad 7 use the ``width``
+    token while items since KiCad 7 use the ``stroke`` token instead.
+
+    Args:
+        - width (float, optional): The ``width`` of the item
+        - stroke (Stroke, optional): The ``stroke`` of the item
+
+    Returns:
+        - str: The ``width`` or ``stroke`` token with a leading whitespace, or an empty string if
+               neither is set
+    """
+    if width is not None:
+        return width_token(width)
+    if stroke is not None:
+        return f' {stroke.to_sexpr(indent=0, newline=False)}'
+    return ''
+
 
 def remove_prefix(input: str, prefix: str) -> str:
     """Removes the given prefix from a string (to remove incompatibility of ``str.removeprefix()``
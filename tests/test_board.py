@@ -149,3 +149,14 @@ class Tests_Board_Since_V7(unittest.TestCase):
         self.testData.pathToTestFile = path.join(BOARD_BASE, 'since_v7', 'test_textKnockout')
         footprint = Board().from_file(self.testData.pathToTestFile)
         self.assertTrue(to_file_and_compare(footprint, self.testData))
+
+    def test_graphicItemWithoutWriteTo(self):
+        """Tests that graphic items which only implement ``to_sexpr()`` are still written when the
+        board is serialized"""
+        class ToSexprOnlyItem():
+            def to_sexpr(self, indent=2, newline=True):
+                return ' '*indent + '(custom_item)\n'
+
+        board = Board.create_new()
+        board.graphicItems.append(ToSexprOnlyItem())
+        self.assertIn('\n  (custom_item)\n', board.to_sexpr())
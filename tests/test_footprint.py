@@ -8,6 +8,7 @@ License identifier:
 """
 
 import unittest
+from io import StringIO
 from os import path
 
 from tests.testfunctions import to_file_and_compare, prepare_test, cleanup_after_test, TEST_BASE
@@ -119,6 +120,28 @@ class Tests_Footprint(unittest.TestCase):
         footprint = Footprint().from_file(self.testData.pathToTestFile)
         self.assertTrue(to_file_and_compare(footprint, self.testData))
 
+    def test_graphicItemsWriteToSharedBuffer(self):
+        """Tests that writing all footprint graphic items into one shared buffer using their
+        ``write_to()`` method yields the same output as concatenating their ``to_sexpr()`` output"""
+        self.testData.pathToTestFile = path.join(FOOTPRINT_BASE, 'test_allFootprintItems')
+        footprint = Footprint().from_file(self.testData.pathToTestFile)
+        buffer = StringIO()
+        for item in footprint.graphicItems:
+            item.write_to(buffer, indent=2)
+        expected = ''.join(item.to_sexpr(indent=2) for item in footprint.graphicItems)
+        self.assertEqual(buffer.getvalue(), expected)
+
+    def test_graphicItemWithoutWriteTo(self):
+        """Tests that graphic items which only implement ``to_sexpr()`` are still written when the
+        footprint is serialized"""
+        class ToSexprOnlyItem():
+            def to_sexpr(self, indent=2, newline=True):
+                return ' '*indent + '(custom_item)\n'
+
+        footprint = Footprint.create_new(library_id='Test', value='Test')
+        footprint.graphicItems.append(ToSexprOnlyItem())
+        self.assertIn('\n  (custom_item)\n', footprint.to_sexpr())
+
 class Tests_Footprint_Since_V7(unittest.TestCase):
     """Test cases for Footprints since KiCad 7"""
 
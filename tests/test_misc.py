@@ -8,8 +8,15 @@ License identifier:
 """
 
 import unittest
+from copy import deepcopy
+from decimal import Decimal
 from os import path
 from kiutils.schematic import Schematic
+from kiutils.items.fpitems import FpArc, FpCurve, FpLine, FpPoly
+from kiutils.items.gritems import GrCurve, GrPoly
+from kiutils.items.schitems import Junction, NetclassFlag, SchematicSymbol, SymbolProjectInstance, SymbolProjectPath
+from kiutils.items.common import Position
+from kiutils.utils import sexpr
 
 from tests.testfunctions import to_file_and_compare, prepare_test, TEST_BASE
 
@@ -33,3 +40,86 @@ class Tests_Misc(unittest.TestCase):
         self.testData.compareToTestFile = True
         libtable = Schematic().from_file(self.testData.pathToTestFile)
         self.assertTrue(to_file_and_compare(libtable, self.testData))
+
+    def test_slottedDataclasses(self):
+        """Tests that dataclasses decorated with ``add_slots`` do not carry an instance dictionary
+        and still behave like regular dataclasses when being created, compared and copied"""
+        arc = FpArc(start=Position(X=1, Y=2), layer='F.SilkS')
+        self.assertFalse(hasattr(arc, '__dict__'))
+        self.assertEqual(arc.layer, 'F.SilkS')
+        self.assertEqual(arc.width, 0.12)
+
+        copied = deepcopy(arc)
+        self.assertEqual(copied, arc)
+        copied.start.X = 3
+        self.assertEqual(arc.start.X, 1)
+
+        with self.assertRaises(AttributeError):
+            arc.unknownAttribute = True
+
+        poly = GrPoly(coordinates=[Position(X=0, Y=0), Position(X=1, Y=1)])
+        self.assertFalse(hasattr(poly, '__dict__'))
+        self.assertEqual(len(GrPoly().coordinates), 0)
+        self.assertEqual(deepcopy(poly), poly)
+
+        # Fields of a slotted base class must not be redefined by the derived class
+        instance = SymbolProjectInstance(name='project', paths=[SymbolProjectPath(reference='R1')])
+        self.assertFalse(hasattr(instance, '__dict__'))
+        self.assertEqual(SymbolProjectInstance.__slots__, ('paths',))
+        self.assertEqual(deepcopy(instance), instance)
+
+        symbol = SchematicSymbol()
+        symbol.libId = 'Device:R'
+        self.assertFalse(hasattr(symbol, '__dict__'))
+        self.assertEqual(symbol.libraryNickname, 'Device')
+        self.assertEqual(symbol.entryName, 'R')
+
+    def test_internedLayerNames(self):
+        """Tests that footprint graphic items parsed from different S-Expressions share the same
+        string object for equal layer names"""
+        first = FpLine.from_sexpr(sexpr.parse_sexp('(fp_line (start 0 0) (end 1 1) (layer "F.SilkS") (width 0.12))'))
+        second = FpLine.from_sexpr(sexpr.parse_sexp('(fp_line (start 1 1) (end 2 2) (layer "F.SilkS") (width 0.12))'))
+        self.assertEqual(first.layer, 'F.SilkS')
+        self.assertIs(first.layer, second.layer)
+
+    def test_junctionDiameter(self):
+        """Tests that the diameter of a junction is parsed into the ``diameter`` field and does not
+        overwrite the junction's color"""
+        junction = Junction.from_sexpr(sexpr.parse_sexp('(junction (at 10 20) (diameter 0.9144) (color 0 0 0 0) (uuid abc))'))
+        self.assertEqual(junction.diameter, 0.9144)
+        self.assertEqual(junction.color.R, 0)
+        self.assertIn('(diameter 0.9144) (color 0 0 0 0)', junction.to_sexpr())
+
+        reparsed = Junction.from_sexpr(sexpr.parse_sexp(junction.to_sexpr()))
+        self.assertEqual(reparsed.diameter, junction.diameter)
+        self.assertEqual(reparsed.to_sexpr(), junction.to_sexpr())
+
+    def test_netclassFlagDefaults(self):
+        """Tests that a new netclass flag gets its own position and effects instances and can be
+        serialized without setting them first"""
+        first, second = NetclassFlag(), NetclassFlag()
+        self.assertIsInstance(first.position, Position)
+        self.assertIsNot(first.position, second.position)
+        self.assertIn('(at 0.0 0.0)', first.to_sexpr())
+
+    def test_pointCoordinatesUseStrFormatting(self):
+        """Tests that polygon and curve points are written like every other number in the file,
+        also when the coordinates are not plain ints or floats"""
+        points = [Position(X=Decimal('1.5'), Y=2.0), Position(X=0, Y=0)]
+        for item in [FpPoly(coordinates=points), FpCurve(coordinates=points),
+                     GrPoly(coordinates=points), GrCurve(coordinates=points)]:
+            output = item.to_sexpr()
+            self.assertIn('(xy 1.5 2.0)', output)
+            self.assertIn('(xy 0 0)', output)
+            self.assertNotIn('Decimal', output)
+
+    def test_widthAndStrokeLastTokenWins(self):
+        """Tests that the ``width`` and ``stroke`` tokens of footprint graphic items are mutually
+        exclusive and that the token coming last in the S-Expression wins"""
+        line = FpLine.from_sexpr(sexpr.parse_sexp('(fp_line (start 0 0) (end 1 1) (stroke (width 0.2) (type solid)) (width 0.12))'))
+        self.assertEqual(line.width, 0.12)
+        self.assertIsNone(line.stroke)
+
+        line = FpLine.from_sexpr(sexpr.parse_sexp('(fp_line (start 0 0) (end 1 1) (width 0.12) (stroke (width 0.2) (type solid)))'))
+        self.assertIsNone(line.width)
+        self.assertEqual(line.stroke.width, 0.2)
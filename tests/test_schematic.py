@@ -208,3 +208,22 @@ class Tests_Schematic_Since_V7(unittest.TestCase):
         self.assertTrue(schematic.libSymbols[1].units[1].libId == "Filter_EMI_LLL_162534_1_1_1")
 
         self.assertTrue(to_file_and_compare(schematic, self.testData))
+
+    def test_itemsWithoutWriteTo(self):
+        """Tests that graphical items, symbols and sheets which only implement ``to_sexpr()`` are
+        still written when the schematic is serialized"""
+        class ToSexprOnlyItem():
+            def __init__(self, token):
+                self.token = token
+
+            def to_sexpr(self, indent=2, newline=True):
+                return ' '*indent + f'({self.token})\n'
+
+        schematic = Schematic.create_new()
+        schematic.graphicalItems.append(ToSexprOnlyItem('custom_item'))
+        schematic.schematicSymbols.append(ToSexprOnlyItem('custom_symbol'))
+        schematic.sheets.append(ToSexprOnlyItem('custom_sheet'))
+        output = schematic.to_sexpr()
+        self.assertIn('\n  (custom_item)\n', output)
+        self.assertIn('\n  (custom_symbol)\n', output)
+        self.assertIn('\n  (custom_sheet)\n', output)